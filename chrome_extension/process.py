@@ -1,9 +1,20 @@
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Response
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
-from typing import List
-from ollama import chat
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from pydantic import BaseModel, ConfigDict
+from typing import AsyncIterator, List, Optional, Tuple
+from collections import OrderedDict
+from ollama import AsyncClient
+import asyncio
 import json
+import logging
+import os
+import time
+import orjson
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
 
 # Pydantic models for structured output
 class Stage(BaseModel):
@@ -16,15 +27,66 @@ class LearningPlan(BaseModel):
     topic_name: str
     stages: List[Stage]
 
-# Function to generate learning plan using Ollama
-def generate_learning_plan(topic: str, model: str = "llama3.2") -> LearningPlan:
-    if not topic or not topic.strip():
-        raise ValueError("Topic cannot be empty")
+class LearningPlanBatch(BaseModel):
+    plans: List[LearningPlan]
 
-    # Define the prompt for Ollama
-    prompt = f"""
-    You are an educational assistant. Given the topic '{topic}', generate a structured learning plan with:
+# JSON schemas handed to Ollama for structured output; the models never change at runtime
+_LEARNING_PLAN_SCHEMA = LearningPlan.model_json_schema()
+_LEARNING_PLAN_BATCH_SCHEMA = LearningPlanBatch.model_json_schema()
+
+def _is_stage_shaped(stage) -> bool:
+    return (
+        isinstance(stage, dict)
+        and isinstance(stage.get("header"), str)
+        and isinstance(stage.get("details"), str)
+        and isinstance(stage.get("keywords"), list)
+        and all(isinstance(keyword, str) for keyword in stage["keywords"])
+        and isinstance(stage.get("status", "pending"), str)
+    )
+
+# Parse Ollama's structured output into a LearningPlan
+def parse_learning_plan(content: str) -> LearningPlan:
+    """
+    Ollama is asked to follow _LEARNING_PLAN_SCHEMA, so output that already has
+    exactly that shape is built with model_construct, skipping Pydantic's per-field
+    validation. Anything else falls back to full model_validate_json.
+    """
+    try:
+        data = orjson.loads(content)
+    except orjson.JSONDecodeError:
+        return LearningPlan.model_validate_json(content)
     
+    if not (
+        isinstance(data, dict)
+        and isinstance(data.get("topic_name"), str)
+        and isinstance(data.get("stages"), list)
+        and all(_is_stage_shaped(stage) for stage in data["stages"])
+    ):
+        return LearningPlan.model_validate_json(content)
+    
+    stages = [
+        Stage.model_construct(
+            header=stage["header"],
+            details=stage["details"],
+            keywords=stage["keywords"],
+            status=stage.get("status", "pending")
+        )
+        for stage in data["stages"]
+    ]
+    return LearningPlan.model_construct(topic_name=data["topic_name"], stages=stages)
+
+# Shared Ollama client; its httpx connection pool is reused across requests
+ollama_client: Optional[AsyncClient] = None
+
+def get_ollama_client() -> AsyncClient:
+    """Return the shared Ollama client, creating it if startup has not run yet."""
+    global ollama_client
+    if ollama_client is None:
+        ollama_client = AsyncClient()
+    return ollama_client
+
+# Prompt text around the topic, built once; only the topic changes between requests
+_PLAN_INSTRUCTIONS = """
     1. A refined topic name (fix typos, capitalize properly, make concise).
     2. A list of 5-10 stages, each with:
        - A header (concise stage title).
@@ -35,50 +97,179 @@ def generate_learning_plan(topic: str, model: str = "llama3.2") -> LearningPlan:
     Make sure the learning plan is comprehensive, well-structured, and progresses logically from basic to advanced concepts.
     The keywords should be specific and useful for finding relevant online resources.
     """
+_PROMPT_PREFIX = """
+    You are an educational assistant. Given the topic '"""
+_PROMPT_SUFFIX = """', generate a structured learning plan with:
+    """ + _PLAN_INSTRUCTIONS
+# Several topics in one prompt share the same instructions; the topics go between these
+_GROUP_PROMPT_PREFIX = """
+    You are an educational assistant. For each of the {count} topics below, generate a structured learning plan.
+    
+    Topics:
+"""
+_GROUP_PROMPT_SUFFIX = """
+    
+    Return a "plans" array with exactly one plan per topic, in the same order as the [i] identifiers. Each plan has:
+    """ + _PLAN_INSTRUCTIONS
+_SYSTEM_MESSAGE = {
+    'role': 'system',
+    'content': 'You are a helpful educational assistant that generates structured JSON output for learning plans.'
+}
+
+def _plan_messages(topic: str) -> List[dict]:
+    # Define the prompt for Ollama
+    return _chat_messages(_PROMPT_PREFIX + topic + _PROMPT_SUFFIX)
+
+def _plan_group_messages(topics: List[str]) -> List[dict]:
+    numbered_topics = "\n".join(f"    [{i}] {topic}" for i, topic in enumerate(topics, start=1))
+    return _chat_messages(_GROUP_PROMPT_PREFIX.format(count=len(topics)) + numbered_topics + _GROUP_PROMPT_SUFFIX)
+
+def _chat_messages(prompt: str) -> List[dict]:
+    return [
+        _SYSTEM_MESSAGE,
+        {
+            'role': 'user',
+            'content': prompt
+        }
+    ]
+
+def _message_content(response) -> str:
+    # Handle different response formats from Ollama
+    if isinstance(response, dict):
+        if 'message' in response:
+            return response['message'].get('content', '')
+        # Sometimes Ollama returns the content directly
+        return response.get('content', str(response))
+    # If it's an object with attributes
+    return response.message.content if hasattr(response, 'message') else str(response)
+
+# Function to generate learning plan using Ollama
+async def generate_learning_plan(topic: str, model: str = "llama3.2") -> LearningPlan:
+    if not topic or not topic.strip():
+        raise ValueError("Topic cannot be empty")
 
     try:
-        print(f"🤖 Generating learning plan for: '{topic}' using model: {model}")
+        logger.info("🤖 Generating learning plan for: '%s' using model: %s", topic, model)
         
-        response = chat(
-            messages=[
-                {
-                    'role': 'system',
-                    'content': 'You are a helpful educational assistant that generates structured JSON output for learning plans.'
-                },
-                {
-                    'role': 'user',
-                    'content': prompt
-                }
-            ],
+        response = await get_ollama_client().chat(
+            messages=_plan_messages(topic),
             model=model,
-            format=LearningPlan.model_json_schema()
+            format=_LEARNING_PLAN_SCHEMA
         )
-        print(f"🔍 Response structure: {type(response)}")
-        print(f"🔍 Response keys: {response.keys() if isinstance(response, dict) else 'Not a dict'}")
-        print(f"🔍 Full response: {response}")
+        logger.debug("🔍 Response structure: %s", type(response))
+        logger.debug("🔍 Full response: %r", response)
         
         # Parse and validate response using Pydantic
-        # Handle different response formats from Ollama
-        if isinstance(response, dict):
-            if 'message' in response:
-                content = response['message'].get('content', '')
-            else:
-                # Sometimes Ollama returns the content directly
-                content = response.get('content', str(response))
-        else:
-            # If it's an object with attributes
-            content = response.message.content if hasattr(response, 'message') else str(response)
-        
-        print(f"🔍 Extracted content: {content}")
-        learning_plan = LearningPlan.model_validate_json(content)
+        content = _message_content(response)
+        logger.debug("🔍 Extracted content: %s", content)
+        learning_plan = parse_learning_plan(content)
         
-        print(f"✅ Successfully generated plan with {len(learning_plan.stages)} stages")
+        logger.info("✅ Successfully generated plan with %d stages", len(learning_plan.stages))
         return learning_plan
         
     except Exception as e:
-        print(f"❌ Error generating learning plan: {str(e)}")
+        logger.error("❌ Error generating learning plan: %s", e)
         raise HTTPException(status_code=500, detail=f"Failed to generate learning plan: {str(e)}")
 
+# Generated plans keyed by normalized (topic, model); repeat topics skip the LLM entirely
+_PLAN_CACHE_MAX_ENTRIES = 512
+_plan_cache: "OrderedDict[Tuple[str, str], LearningPlan]" = OrderedDict()
+
+async def get_learning_plan(topic: str, model: str = "llama3.2") -> Tuple[LearningPlan, bool]:
+    """
+    Return a learning plan for the topic, reusing a previously generated one when possible.
+    
+    Returns the plan and whether it was served from the cache.
+    """
+    key = (topic.strip().lower(), model)
+    plan = _cached_plan(key)
+    if plan is not None:
+        return plan, True
+    
+    plan = await generate_learning_plan(topic, model)
+    _remember_plan(key, plan)
+    return plan, False
+
+def _cached_plan(key: Tuple[str, str]) -> Optional[LearningPlan]:
+    plan = _plan_cache.get(key)
+    if plan is not None:
+        _plan_cache.move_to_end(key)
+    return plan
+
+def _remember_plan(key: Tuple[str, str], plan: LearningPlan) -> None:
+    _plan_cache[key] = plan
+    if len(_plan_cache) > _PLAN_CACHE_MAX_ENTRIES:
+        _plan_cache.popitem(last=False)
+
+# Stream a learning plan from Ollama as NDJSON lines
+async def stream_learning_plan(topic: str, model: str = "llama3.2") -> AsyncIterator[bytes]:
+    """
+    Yield {"content": ...} lines with each piece of text as Ollama generates it, then one
+    final {"done": true, "plan": {...}} line, or {"done": true, "error": "..."} on failure.
+    """
+    key = (topic.strip().lower(), model)
+    plan = _cached_plan(key)
+    if plan is None:
+        parts = []
+        try:
+            logger.info("🤖 Streaming learning plan for: '%s' using model: %s", topic, model)
+            stream = await get_ollama_client().chat(
+                messages=_plan_messages(topic),
+                model=model,
+                format=_LEARNING_PLAN_SCHEMA,
+                stream=True
+            )
+            async for chunk in stream:
+                piece = _message_content(chunk)
+                if piece:
+                    parts.append(piece)
+                    yield orjson.dumps({"content": piece}) + b"\n"
+            plan = parse_learning_plan("".join(parts))
+        except Exception as e:
+            logger.error("❌ Error streaming learning plan: %s", e)
+            yield orjson.dumps({"done": True, "error": f"Failed to generate learning plan: {str(e)}"}) + b"\n"
+            return
+        _remember_plan(key, plan)
+    
+    yield orjson.dumps({"done": True, "plan": plan.model_dump()}) + b"\n"
+
+# Generate plans for several topics in a single Ollama call
+async def _generate_plan_group(topics: List[str], model: str) -> List[LearningPlan]:
+    response = await get_ollama_client().chat(
+        messages=_plan_group_messages(topics),
+        model=model,
+        format=_LEARNING_PLAN_BATCH_SCHEMA
+    )
+    
+    batch = LearningPlanBatch.model_validate_json(_message_content(response))
+    if len(batch.plans) != len(topics):
+        raise ValueError(f"Expected {len(topics)} plans from the model, got {len(batch.plans)}")
+    return batch.plans
+
+async def generate_learning_plans_batch(topics: List[str], b: int = 4, model: str = "llama3.2") -> List[LearningPlan]:
+    """
+    Generate one learning plan per topic, prompting Ollama with up to `b` topics per call.
+    
+    The shared instructions are sent (and prefilled) once per group instead of once per topic,
+    so N topics cost ceil(N / b) generations. Groups are sent concurrently.
+    """
+    if any(not topic or not topic.strip() for topic in topics):
+        raise ValueError("Topic cannot be empty")
+    if b < 1:
+        raise ValueError("Batch size must be at least 1")
+    
+    groups = [topics[i:i + b] for i in range(0, len(topics), b)]
+    try:
+        logger.info("🤖 Generating %d learning plans in %d call(s) using model: %s", len(topics), len(groups), model)
+        results = await asyncio.gather(*(_generate_plan_group(group, model) for group in groups))
+    except Exception as e:
+        logger.error("❌ Error generating learning plans: %s", e)
+        raise HTTPException(status_code=500, detail=f"Failed to generate learning plans: {str(e)}")
+    
+    plans = [plan for group_plans in results for plan in group_plans]
+    logger.info("✅ Successfully generated %d plans", len(plans))
+    return plans
+
 # FastAPI application
 app = FastAPI(
     title="Learning Plan Generator with Ollama",
@@ -105,23 +296,80 @@ app = FastAPI(
     # Pull a model
     ollama pull llama3.2
     ```
+    
+    ### Concurrency:
+    Requests are sent to Ollama asynchronously, and `/generate-plans` runs a whole
+    batch of topics concurrently. How many generations actually run in parallel is
+    decided by the Ollama server:
+    - `OLLAMA_NUM_PARALLEL`: parallel requests each loaded model will serve
+    - `OLLAMA_MAX_LOADED_MODELS`: models that may stay loaded at the same time
+    
+    When started with `python process.py`, the API runs a single uvicorn worker; set
+    `WEB_CONCURRENCY` to run more. Each worker keeps its own plan, `/models` and `/health`
+    caches, so repeated topics hit the plan cache less often as workers are added.
+    Each worker logs the Ollama settings above on startup.
     """,
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse
 )
 
+class _StreamFriendlyGZipMiddleware(GZipMiddleware):
+    """GZip that leaves /stream endpoints alone; gzip would hold small chunks back until its buffer fills."""
+    
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http" and scope["path"].endswith("/stream"):
+            await self.app(scope, receive, send)
+            return
+        await super().__call__(scope, receive, send)
+
+# Compress larger responses (full learning plans are several KB of text)
+app.add_middleware(_StreamFriendlyGZipMiddleware, minimum_size=1024)
+
+# Origins are matched exactly; set CHROME_EXTENSION_ORIGIN to e.g. chrome-extension://<extension id>
+_allowed_origins = [
+    "http://localhost:3000",  # Allow local backend
+    "http://localhost:8000",  # Allow self
+]
+if os.getenv("CHROME_EXTENSION_ORIGIN"):
+    _allowed_origins.append(os.getenv("CHROME_EXTENSION_ORIGIN"))
+
 # Add CORS middleware
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=[
-        "chrome-extension://*",  # Allow all Chrome extensions
-        "http://localhost:3000",  # Allow local backend
-        "http://localhost:8000",  # Allow self
-    ],
+    allow_origins=_allowed_origins,
     allow_credentials=True,
-    allow_methods=["*"],  # Allow all methods
-    allow_headers=["*"],  # Allow all headers
+    allow_methods=["GET", "POST"],  # Only the methods the API uses
+    allow_headers=["content-type"],  # The extension only sends Content-Type
+    expose_headers=["X-Cache"],  # Let the extension see plan cache hits
+    max_age=86400,  # Let browsers cache preflight responses for a day
 )
 
+@app.on_event("startup")
+async def startup_event():
+    """Open the shared Ollama client for this worker."""
+    get_ollama_client()
+    # These are read by the Ollama server, not by this process; logged to make the effective setup visible
+    logger.info(
+        "Ollama parallelism: OLLAMA_NUM_PARALLEL=%s, OLLAMA_MAX_LOADED_MODELS=%s",
+        os.getenv("OLLAMA_NUM_PARALLEL", "unset (Ollama default)"),
+        os.getenv("OLLAMA_MAX_LOADED_MODELS", "unset (Ollama default)")
+    )
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Close the shared Ollama client's connection pool."""
+    global ollama_client
+    if ollama_client is not None:
+        # AsyncClient has no close method of its own; its httpx client lives on a private
+        # attribute, so close it only if it is still there and never let shutdown fail on it
+        aclose = getattr(getattr(ollama_client, "_client", None), "aclose", None)
+        if aclose is not None:
+            try:
+                await aclose()
+            except Exception as e:
+                logger.warning("Could not close the Ollama client: %s", e)
+        ollama_client = None
+
 # Request model for FastAPI endpoint
 class TopicRequest(BaseModel):
     topic: str
@@ -190,6 +438,11 @@ async def generate_plan(request: TopicRequest):
         - **keywords**: List of 3-5 relevant search terms for online research
         - **status**: Current status (always "pending" for new plans)
     
+    ### Caching:
+    Plans are cached per topic (case- and whitespace-insensitive) and model, so asking
+    for the same topic again returns the earlier plan immediately. The `X-Cache` response
+    header is `HIT` when the plan came from the cache and `MISS` when it was generated.
+    
     ## Error Responses
     
     - **400 Bad Request**: Invalid topic (empty or whitespace-only)
@@ -214,13 +467,141 @@ async def generate_plan(request: TopicRequest):
     Check available models with: `ollama list`
     """
     try:
-        plan = generate_learning_plan(request.topic, request.model)
-        return plan
+        plan, cache_hit = await get_learning_plan(request.topic, request.model)
+        # response_model only documents the schema; the plan is already a LearningPlan,
+        # so serialize it once here instead of letting FastAPI re-validate and re-encode it
+        return Response(
+            content=plan.model_dump_json(),
+            media_type="application/json",
+            headers={"X-Cache": "HIT" if cache_hit else "MISS"}
+        )
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error generating plan: {str(e)}")
 
+@app.post("/generate-plan/stream")
+async def generate_plan_stream(request: TopicRequest):
+    """
+    Stream a learning plan for a given topic as it is generated.
+    
+    Takes the same request body as `/generate-plan`, but responds with newline-delimited
+    JSON (`application/x-ndjson`) so the client can show progress long before the plan
+    is complete:
+    
+    ```
+    {"content": "..."}
+    {"content": "..."}
+    {"done": true, "plan": {"topic_name": "Machine Learning Fundamentals", "stages": [...]}}
+    ```
+    
+    The last line always has `"done": true` and carries either the validated `plan`
+    (same format as `/generate-plan`) or an `error` message. Cached topics return only
+    the final line.
+    """
+    if not request.topic or not request.topic.strip():
+        raise HTTPException(status_code=400, detail="Topic cannot be empty")
+    return StreamingResponse(
+        stream_learning_plan(request.topic, request.model),
+        media_type="application/x-ndjson"
+    )
+
+class PlanBatchResult(BaseModel):
+    topic: str
+    plan: Optional[LearningPlan] = None
+    error: Optional[str] = None
+
+@app.post("/generate-plans", response_model=List[PlanBatchResult])
+async def generate_plans(requests: List[TopicRequest]):
+    """
+    Generate learning plans for several topics in one call.
+    
+    All topics are sent to Ollama concurrently, so the batch takes roughly as long
+    as its slowest plan (up to `OLLAMA_NUM_PARALLEL` on the Ollama side) instead of
+    the sum of all of them.
+    
+    ## Request Format
+    
+    ```json
+    [
+        {"topic": "machine learning fundamentals", "model": "llama3.2"},
+        {"topic": "web development with React", "model": "llama3.2"}
+    ]
+    ```
+    
+    ## Response Format
+    
+    One entry per requested topic, in request order. Each entry holds either the
+    generated `plan` or an `error` message, so one failing topic does not fail the batch:
+    
+    ```json
+    [
+        {"topic": "machine learning fundamentals", "plan": {"topic_name": "...", "stages": [...]}, "error": null},
+        {"topic": "", "plan": null, "error": "Topic cannot be empty"}
+    ]
+    ```
+    """
+    results = await asyncio.gather(
+        *(get_learning_plan(request.topic, request.model) for request in requests),
+        return_exceptions=True
+    )
+    
+    batch = []
+    for request, result in zip(requests, results):
+        if isinstance(result, tuple):
+            plan, _ = result
+            batch.append(PlanBatchResult(topic=request.topic, plan=plan))
+        else:
+            error = result.detail if isinstance(result, HTTPException) else str(result)
+            batch.append(PlanBatchResult(topic=request.topic, error=error))
+    return batch
+
+class BatchTopicRequest(BaseModel):
+    topics: List[str]
+    model: str = "llama3.2"
+    batch_size: int = 4
+    
+    model_config = ConfigDict(json_schema_extra={
+        "example": {
+            "topics": ["machine learning fundamentals", "web development with React"],
+            "model": "llama3.2",
+            "batch_size": 4
+        }
+    })
+
+@app.post("/generate-plans-batch", response_model=List[LearningPlan])
+async def generate_plans_batch(request: BatchTopicRequest):
+    """
+    Generate learning plans for several topics, packing up to `batch_size` topics into each Ollama prompt.
+    
+    Compared to `/generate-plans`, this makes fewer, longer LLM calls: the instructions are
+    shared by every topic in a group. The trade-off is that the whole request fails if any
+    group fails, and plan quality can drop with larger groups on small models.
+    
+    ## Request Format
+    
+    ```json
+    {
+        "topics": ["machine learning fundamentals", "web development with React"],
+        "model": "llama3.2",
+        "batch_size": 4
+    }
+    ```
+    
+    ## Response Format
+    
+    A list of learning plans (same format as `/generate-plan`), in the same order as `topics`.
+    """
+    try:
+        return await generate_learning_plans_batch(request.topics, request.batch_size, request.model)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+# `ollama list` output is cached briefly; the installed models rarely change between calls
+_MODELS_CACHE_TTL_SECONDS = 30
+_models_cache = {"models": None, "expires": 0.0}
+_models_lock = asyncio.Lock()
+
 # Additional endpoint to check available models
 @app.get("/models")
 async def get_available_models():
@@ -228,48 +609,76 @@ async def get_available_models():
     Get list of available Ollama models.
     
     Returns a list of models available in your local Ollama installation.
+    The list is cached for 30 seconds, so newly pulled models may take that long to appear.
     """
     try:
-        import subprocess
-        result = subprocess.run(['ollama', 'list'], capture_output=True, text=True)
-        if result.returncode == 0:
-            # Parse the output to extract model names
-            lines = result.stdout.strip().split('\n')[1:]  # Skip header
-            models = []
-            for line in lines:
-                if line.strip():
-                    model_name = line.split()[0]
-                    models.append(model_name)
-            return {"models": models}
-        else:
-            raise HTTPException(status_code=500, detail="Failed to fetch models from Ollama")
+        # One caller refreshes the cache while concurrent callers wait for its result
+        async with _models_lock:
+            if _models_cache["models"] is not None and time.monotonic() < _models_cache["expires"]:
+                return {"models": list(_models_cache["models"])}
+            
+            # Run the CLI without blocking the event loop
+            proc = await asyncio.create_subprocess_exec(
+                'ollama', 'list',
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE
+            )
+            stdout, _ = await proc.communicate()
+            if proc.returncode == 0:
+                # Parse the output to extract model names
+                lines = stdout.decode().strip().split('\n')[1:]  # Skip header
+                models = []
+                for line in lines:
+                    if line.strip():
+                        model_name = line.split()[0]
+                        models.append(model_name)
+                _models_cache["models"] = models
+                _models_cache["expires"] = time.monotonic() + _MODELS_CACHE_TTL_SECONDS
+                return {"models": list(models)}
+            else:
+                raise HTTPException(status_code=500, detail="Failed to fetch models from Ollama")
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error fetching models: {str(e)}")
 
+# Health probes should fail fast rather than queue behind a busy Ollama
+_HEALTH_PROBE_TIMEOUT_SECONDS = 1.0
+
+# Probes from load balancers arrive in bursts; serve the serialized result for a second
+_HEALTH_CACHE_TTL_SECONDS = 1.0
+_health_cache: Optional[Tuple[float, bytes]] = None
+_HEALTH_HEADERS = {"Cache-Control": f"max-age={int(_HEALTH_CACHE_TTL_SECONDS)}"}
+
 # Health check endpoint
 @app.get("/health")
 async def health_check():
     """
     Health check endpoint to verify the API and Ollama are working.
+    
+    The result is cached for 1 second, so a burst of probes costs one Ollama call.
     """
+    global _health_cache
+    if _health_cache is not None and time.monotonic() - _health_cache[0] < _HEALTH_CACHE_TTL_SECONDS:
+        return Response(_health_cache[1], media_type="application/json", headers=_HEALTH_HEADERS)
+    
     try:
-        # Test Ollama connection
-        response = chat(
-            messages=[{"role": "user", "content": "Hello"}],
-            model="llama3.2"
-        )
-        return {
+        # Test Ollama connection via /api/tags, which answers without loading or running a model
+        await asyncio.wait_for(get_ollama_client().list(), timeout=_HEALTH_PROBE_TIMEOUT_SECONDS)
+        result = {
             "status": "healthy",
             "ollama_status": "connected",
             "message": "Learning Plan Generator API is running with Ollama"
         }
     except Exception as e:
-        return {
+        result = {
             "status": "unhealthy",
             "ollama_status": "disconnected",
-            "error": str(e),
+            "error": str(e) or type(e).__name__,  # timeouts carry no message
             "message": "Ollama may not be running or model not available"
         }
+    
+    payload = orjson.dumps(result)
+    _health_cache = (time.monotonic(), payload)
+    return Response(payload, media_type="application/json", headers=_HEALTH_HEADERS)
 
 # Run the server (for local testing)
 if __name__ == "__main__":
@@ -278,4 +687,8 @@ if __name__ == "__main__":
     print("📚 Make sure Ollama is running: ollama serve")
     print("🤖 Available at: http://localhost:8000")
     print("📖 Documentation: http://localhost:8000/docs")
-    uvicorn.run(app, host="0.0.0.0", port=8000)
\ No newline at end of file
+    # Workers need the import string form of the app. One worker by default keeps a single
+    # plan cache; WEB_CONCURRENCY trades cache hits for more processes
+    workers = int(os.getenv("WEB_CONCURRENCY", 1))
+    print(f"⚙️ Workers: {workers}")
+    uvicorn.run("process:app", host="0.0.0.0", port=8000, workers=workers)
\ No newline at end of file
@@ -12,6 +12,7 @@ API Endpoints:
 - POST /api/find-resources: Find learning resources
 - POST /api/generate-summary: Generate learning dashboard
 - POST /api/chat: RAG chatbot for Q&A
+- POST /api/chat/stream: RAG chatbot answer streamed as server-sent events
 - GET /api/status: Pipeline status
 """
 
@@ -25,7 +26,7 @@ from pathlib import Path
 
 from fastapi import FastAPI, HTTPException, BackgroundTasks
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse, FileResponse
+from fastapi.responses import JSONResponse, FileResponse, ORJSONResponse, StreamingResponse
 from fastapi.staticfiles import StaticFiles
 from pydantic import BaseModel
 
@@ -78,7 +79,8 @@ class PipelineStatus(BaseModel):
 app = FastAPI(
     title="Learning Resource Pipeline",
     description="Complete pipeline for learning resource discovery and analysis",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse
 )
 
 # CORS middleware for frontend integration
@@ -116,7 +118,8 @@ class PipelineState:
         """Initialize chatbot after vector DB has content."""
         try:
             if self.vector_db:
-                self.chatbot = RAGChatbot(self.vector_db)
+                # Reuse the chatbot built (with its LLM client) during startup when there is one
+                self.chatbot = self.vector_db.chatbot or RAGChatbot(self.vector_db)
                 print("✅ RAG Chatbot initialized")
                 return True
         except Exception as e:
@@ -126,11 +129,118 @@ class PipelineState:
 # Global pipeline instance
 pipeline = PipelineState()
 
+CHATBOT_NOT_READY_MESSAGE = "I'm not ready yet! Please generate some learning resources first, then I'll be able to help you with questions about your learning content."
+
+class QueryBatcher:
+    """
+    Collects chat questions that arrive within a few milliseconds of each other and
+    retrieves them with a single RAGChatbot.retrieve_batch call, so concurrent questions share
+    one embedding pass and one vector search instead of paying for them separately.
+    
+    Cached and retrieval-only answers are returned as soon as the batch is retrieved; LLM
+    answers are generated per question, so no caller waits for another question's answer.
+    """
+    
+    def __init__(self, max_batch_size: int = 16, max_wait_seconds: float = 0.008):
+        self.max_batch_size = max_batch_size
+        self.max_wait_seconds = max_wait_seconds
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+        self._answer_tasks: set = set()
+    
+    def start(self):
+        """Start the batching task on the running event loop (idempotent)."""
+        if self._worker is None:
+            self._queue = asyncio.Queue()
+            self._worker = asyncio.create_task(self._run())
+    
+    async def stop(self):
+        """Stop the batching task and any answers still being generated."""
+        tasks = list(self._answer_tasks)
+        if self._worker is not None:
+            tasks.append(self._worker)
+            self._worker = None
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+    
+    async def submit(self, question: str, max_sources: int = 3):
+        """Queue a question and wait for its rag_module ChatResponse."""
+        self.start()
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((question, max_sources, future))
+        return await future
+    
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.max_wait_seconds
+            while len(batch) < self.max_batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            # Only retrieval is awaited here; LLM answers finish in their own tasks
+            await self._retrieve(batch)
+    
+    async def _retrieve(self, batch):
+        # retrieve_batch takes one max_sources value, so group questions by it
+        groups: Dict[int, list] = {}
+        for item in batch:
+            groups.setdefault(item[1], []).append(item)
+        
+        for max_sources, items in groups.items():
+            try:
+                if not pipeline.chatbot:
+                    raise RuntimeError("Chatbot is not initialized")
+                # Embedding and search block, so keep them off the event loop
+                entries = await asyncio.to_thread(
+                    pipeline.chatbot.retrieve_batch, [question for question, _, _ in items], max_sources
+                )
+            except Exception as e:
+                for _, _, future in items:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+            
+            for (_, _, future), entry in zip(items, entries):
+                if callable(entry):
+                    task = asyncio.create_task(self._answer(entry, future))
+                    self._answer_tasks.add(task)
+                    task.add_done_callback(self._answer_tasks.discard)
+                elif not future.done():
+                    future.set_result(entry)
+    
+    @staticmethod
+    async def _answer(generate, future):
+        # The LLM call blocks, so run it in a worker thread
+        try:
+            response = await asyncio.to_thread(generate)
+        except Exception as e:
+            if not future.done():
+                future.set_exception(e)
+            return
+        if not future.done():
+            future.set_result(response)
+
+# Global query batcher for /api/chat
+batcher = QueryBatcher()
+
 @app.on_event("startup")
 async def startup_event():
     """Initialize pipeline on server startup."""
     print("🚀 Starting Learning Resource Pipeline Server...")
     pipeline.initialize()
+    batcher.start()
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Stop background tasks on server shutdown."""
+    await batcher.stop()
 
 # Serve static files (for dashboard)
 if not os.path.exists("static"):
@@ -212,37 +322,28 @@ async def chat_endpoint(request: ChatRequest):
     """
     RAG chatbot endpoint for answering questions about learning resources.
     """
+    session_id = request.session_id or 'default'
     try:
         if not pipeline.chatbot:
             # If chatbot isn't initialized, return a helpful message
             return ChatResponse(
-                answer="I'm not ready yet! Please generate some learning resources first, then I'll be able to help you with questions about your learning content.",
+                answer=CHATBOT_NOT_READY_MESSAGE,
                 sources=[],
-                session_id=getattr(request, 'session_id', 'default'),
+                session_id=session_id,
                 error=None
             )
         
         print(f"🤖 Processing chat question: {request.question}")
         
-        # Get response from RAG chatbot
-        response = pipeline.chatbot.ask(
-            question=request.question,
-            max_sources=3
-        )
-        
-        # Extract sources if available
-        sources = []
-        if hasattr(response, 'sources') and response.sources:
-            sources = [result.url for result in response.sources if hasattr(result, 'url')]
-        
-        # Extract answer text
-        answer = response.answer if hasattr(response, 'answer') else "Sorry, I couldn't generate a response."
+        # Get response from RAG chatbot, batched with other concurrent questions
+        response = await batcher.submit(request.question, max_sources=3)
         
+        # rag_module's ChatResponse always has these fields; sources are SearchResults
         return ChatResponse(
-            answer=answer,
-            sources=sources,
-            session_id=getattr(request, 'session_id', 'default'),
-            error=response.error if hasattr(response, 'error') else None
+            answer=response.answer or "Sorry, I couldn't generate a response.",
+            sources=[result.chunk.source_url for result in response.sources],
+            session_id=session_id,
+            error=response.error
         )
         
     except Exception as e:
@@ -252,10 +353,45 @@ async def chat_endpoint(request: ChatRequest):
         return ChatResponse(
             answer="Sorry, I encountered an error while processing your question. Please try again later.",
             sources=[],
-            session_id=getattr(request, 'session_id', 'default'),
+            session_id=session_id,
             error=error_msg
         )
 
+@app.post("/api/chat/stream")
+async def chat_stream_endpoint(request: ChatRequest):
+    """
+    Streaming variant of /api/chat using server-sent events.
+    
+    Sends `{"type": "token", "content": ...}` events while the answer is generated,
+    followed by one `{"type": "done", "answer", "sources", "session_id", "error"}` event
+    with the complete answer and its source URLs.
+    """
+    session_id = request.session_id or 'default'
+    
+    async def events():
+        if not pipeline.chatbot:
+            yield _sse_event({"type": "done", "answer": CHATBOT_NOT_READY_MESSAGE, "sources": [],
+                              "session_id": session_id, "error": None})
+            return
+        
+        print(f"🤖 Streaming chat answer for: {request.question}")
+        async for item in pipeline.chatbot.astream(request.question, max_sources=3):
+            if isinstance(item, str):
+                yield _sse_event({"type": "token", "content": item})
+            else:
+                yield _sse_event({
+                    "type": "done",
+                    "answer": item.answer,
+                    "sources": [source.chunk.source_url for source in item.sources],
+                    "session_id": session_id,
+                    "error": item.error
+                })
+    
+    return StreamingResponse(events(), media_type="text/event-stream", headers={"Cache-Control": "no-cache"})
+
+def _sse_event(data: Dict[str, Any]) -> str:
+    return f"data: {json.dumps(data)}\n\n"
+
 def run_server(host: str = "localhost", port: int = 7000, reload: bool = True):
     """Run the FastAPI server."""
     print(f"""
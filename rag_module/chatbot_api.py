@@ -1,9 +1,11 @@
 from fastapi import FastAPI, HTTPException, BackgroundTasks
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel, Field
 from typing import List, Optional
 import logging
 import os
+import time
 from datetime import datetime
 from contextlib import asynccontextmanager
 
@@ -17,6 +19,20 @@ logger = logging.getLogger(__name__)
 # Global variables
 db: Optional[LearningResourceVectorDB] = None
 
+# Response timestamps are reused for up to 100 ms instead of formatted per request
+_TIMESTAMP_REFRESH_SECONDS = 0.1
+_timestamp_iso = ""
+_timestamp_expires = 0.0
+
+def _now_iso() -> str:
+    """Current local time in ISO format, accurate to about 100 ms."""
+    global _timestamp_iso, _timestamp_expires
+    now = time.monotonic()
+    if now >= _timestamp_expires:
+        _timestamp_iso = datetime.now().isoformat()
+        _timestamp_expires = now + _TIMESTAMP_REFRESH_SECONDS
+    return _timestamp_iso
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Initialize and cleanup database connections."""
@@ -43,7 +59,8 @@ app = FastAPI(
     title="Learning Resource Chatbot API",
     description="AI-powered chatbot for answering questions about stored learning resources",
     version="1.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
 app.add_middleware(
@@ -87,8 +104,8 @@ async def chat(request: QuestionRequest):
         
         logger.info(f"Processing question: {request.question[:100]}...")
         
-        # Get response from chatbot
-        response = db.chatbot.ask(request.question, request.max_sources)
+        # Get response from chatbot without blocking the event loop
+        response = await db.chatbot.aask(request.question, request.max_sources)
         
         # Convert sources to API model
         source_infos = []
@@ -98,7 +115,7 @@ async def chat(request: QuestionRequest):
                 url=source.chunk.source_url,
                 content_type=source.chunk.content_type,
                 similarity=source.similarity,
-                content_preview=source.chunk.content[:200] + "..." if len(source.chunk.content) > 200 else source.chunk.content
+                content_preview=source.chunk.preview(200)
             ))
         
         return ChatResponseModel(
@@ -106,7 +123,7 @@ async def chat(request: QuestionRequest):
             sources=source_infos,
             confidence=response.confidence,
             query=response.query,
-            timestamp=datetime.now().isoformat(),
+            timestamp=_now_iso(),
             error=response.error
         )
         
@@ -142,7 +159,7 @@ async def add_resource(request: AddResourceRequest, background_tasks: Background
             "status": "accepted",
             "message": "Resource addition started in background",
             "url": request.url,
-            "timestamp": datetime.now().isoformat()
+            "timestamp": _now_iso()
         }
         
     except Exception as e:
@@ -1,10 +1,19 @@
 import os
+import re
+import asyncio
+import hashlib
 import logging
-from typing import List
-from dataclasses import dataclass
+import threading
+from collections import OrderedDict
+from functools import lru_cache, partial
+from itertools import takewhile
+from typing import AsyncIterator, Callable, List, Optional, Tuple, Union
+from dataclasses import dataclass, replace
+
+import diskcache
+import numpy as np
 
 from langchain_together import Together
-from langchain_core.prompts import PromptTemplate
 from dotenv import load_dotenv
 load_dotenv()
 
@@ -16,14 +25,74 @@ from .vector_database import SearchResult, ChatResponse
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Response cache settings
+_EXACT_CACHE_SIZE = 1024
+_SEMANTIC_CACHE_SIZE = 256
+_SEMANTIC_CACHE_THRESHOLD = 0.95  # Cosine similarity above which two questions count as the same
+
+# Persistent answer cache, shared by all processes using the same cache directory
+_answer_cache: Optional[diskcache.Cache] = None
+_answer_cache_failed = False
+_ANSWER_CACHE_SIZE_LIMIT = int(1e8)
+_ANSWER_CACHE_TTL_SECONDS = 86400
+_CORPUS_VERSION_KEY = "corpus_version"
+
+# Top-source similarity at which the source is returned as the answer instead of calling the LLM
+_DIRECT_ANSWER_SIMILARITY = float(os.getenv("RAG_DIRECT_ANSWER_SIMILARITY", "0.85"))
+
+# Follow-up question suggested when a retrieved chunk mentions the keyword
+_SIMILAR_QUESTION_HINTS = (
+    ("python", "How do I use Python for this task?"),
+    ("tutorial", "Can you explain this step by step?"),
+    ("example", "Can you show me an example?"),
+)
+
+# Answer prompt, split around the two values filled in per question
+_ANSWER_PROMPT_HEAD = """You are a helpful AI assistant that answers questions based on learning resources. Use the following context to answer the user's question accurately and helpfully.
+
+Context from Learning Resources:
+"""
+_ANSWER_PROMPT_MIDDLE = """
+
+Question: """
+_ANSWER_PROMPT_TAIL = """
+
+Instructions:
+- Provide a clear, short and concise answer based primarily on the given context
+- If referencing specific information, mention which source it comes from
+- If the context doesn't fully answer the question, be honest about limitations
+- Keep the answer focused and practical
+- Use a helpful, educational tone
+- Format your response in a readable way with proper paragraphs
+
+Answer:"""
+
+
+@lru_cache(maxsize=4)
+def _get_llm(together_api_key: str) -> Together:
+    """Create the Together LLM client once per key; chatbots rebuilt after new content reuse it."""
+    return Together(
+        model="mistralai/Mixtral-8x7B-Instruct-v0.1",
+        together_api_key=together_api_key,
+        max_tokens=1000,
+        temperature=0.7
+    )
+
 
 class RAGChatbot:
     """RAG-based chatbot for answering questions about stored content."""
     
-    def __init__(self, vector_db):  # vector_db: VectorDatabase - avoiding circular import
+    def __init__(self, vector_db):  # vector_db: LearningResourceVectorDB - avoiding circular import
         self.vector_db = vector_db
         self.llm = None
         self._initialize_llm()
+        
+        # Answers cached by normalized question (exact) and by question embedding (semantic)
+        self._cache_lock = threading.Lock()
+        self._exact_cache: "OrderedDict[Tuple[str, int], ChatResponse]" = OrderedDict()
+        self._semantic_embeddings: Optional[np.ndarray] = None
+        self._semantic_max_sources = np.empty(0, dtype=np.int64)
+        self._semantic_responses: List[ChatResponse] = []
     
     def _initialize_llm(self):
         """Initialize the LLM for generating responses."""
@@ -31,12 +100,7 @@ class RAGChatbot:
         try:
             together_api_key = os.getenv("TOGETHER_API_KEY")
             if together_api_key:
-                self.llm = Together(
-                    model="mistralai/Mixtral-8x7B-Instruct-v0.1",
-                    together_api_key=together_api_key,
-                    max_tokens=1000,
-                    temperature=0.7
-                )
+                self.llm = _get_llm(together_api_key)
                 logger.info("LLM initialized successfully for chatbot")
             else:
                 logger.warning("TOGETHER_API_KEY not found. Chatbot will use simple retrieval only.")
@@ -58,128 +122,405 @@ class RAGChatbot:
             
             question = question.strip()
             
-            # Search for relevant content
-            search_results = self.vector_db.search_resources(question, limit=max_sources * 2)
+            cache_key, query_embedding, cached = self._lookup_cached(question, max_sources)
+            if cached is not None:
+                return cached
             
-            if not search_results:
-                return ChatResponse(
-                    answer="I couldn't find any relevant information in the knowledge base to answer your question. Try asking about topics that are covered in the stored learning resources.",
-                    sources=[],
-                    confidence=0.0,
-                    query=question
-                )
-            
-            # Filter and rank results
-            relevant_sources = []
-            for result in search_results:
-                if result.similarity > 0.5:  # Only include reasonably similar content
-                    relevant_sources.append(result)
-                if len(relevant_sources) >= max_sources:
-                    break
-            
-            if not relevant_sources:
-                # Use lower threshold if no good matches
-                relevant_sources = search_results[:max_sources]
-                return ChatResponse(
-                    answer="I found some content that might be related to your question, but it doesn't seem directly relevant. Here's what I found:",
-                    sources=relevant_sources,
-                    confidence=0.3,
-                    query=question
-                )
+            search_results = self._search(question, query_embedding, max_sources)
+            return self._answer_from_results(question, search_results, max_sources, cache_key, query_embedding)
             
-            # Generate answer using LLM if available
-            if self.llm:
-                answer = self._generate_llm_answer(question, relevant_sources)
-                confidence = min(0.9, max(0.6, sum(r.similarity for r in relevant_sources) / len(relevant_sources)))
+        except Exception as e:
+            return self._error_response(question, e)
+    
+    def ask_batch(self, questions: List[str], max_sources: int = 3) -> List[ChatResponse]:
+        """
+        Answer several questions at once, in order.
+        
+        Uncached questions are embedded with one model call and searched with one
+        vector-database request; answers are then generated per question as in ask().
+        """
+        return [entry if isinstance(entry, ChatResponse) else entry()
+                for entry in self.retrieve_batch(questions, max_sources)]
+    
+    def retrieve_batch(self, questions: List[str], max_sources: int = 3
+                       ) -> List[Union[ChatResponse, Callable[[], ChatResponse]]]:
+        """
+        Do the shared part of ask_batch(): cache lookups, one embedding call and one vector search.
+        
+        Each entry is either a finished ChatResponse (cache hit, nothing relevant found, or an
+        answer that needs no LLM) or a callable that makes that question's LLM call and returns
+        its ChatResponse, so callers can run the slow calls independently of each other.
+        """
+        entries: List[Optional[Union[ChatResponse, Callable[[], ChatResponse]]]] = [None] * len(questions)
+        pending = []  # (position, question, cache_key) still needing retrieval
+        
+        for position, question in enumerate(questions):
+            if not question or not question.strip():
+                entries[position] = self.ask(question, max_sources)
+                continue
+            question = question.strip()
+            cache_key = (self._normalize_question(question), max_sources)
+            cached = self._lookup_exact(cache_key)
+            if cached is not None:
+                entries[position] = replace(cached, query=question)
             else:
-                answer = self._generate_simple_answer(question, relevant_sources)
-                confidence = 0.5
+                pending.append((position, question, cache_key))
+        
+        if pending:
+            try:
+                embeddings = self.vector_db.embed_queries([question for _, question, _ in pending])
+            except Exception as e:
+                logger.error(f"Error embedding question batch, answering one by one: {e}")
+                for position, question, _ in pending:
+                    entries[position] = partial(self.ask, question, max_sources)
+                return entries
             
-            return ChatResponse(
-                answer=answer,
-                sources=relevant_sources,
-                confidence=confidence,
-                query=question
-            )
+            to_search = []
+            for (position, question, cache_key), embedding in zip(pending, embeddings):
+                cached = self._lookup_semantic(embedding, max_sources)
+                if cached is not None:
+                    self._remember_exact(cache_key, cached)
+                    entries[position] = replace(cached, query=question)
+                else:
+                    to_search.append((position, question, cache_key, embedding))
             
+            if to_search:
+                results_per_question = self.vector_db.search_resources_by_embeddings(
+                    np.stack([embedding for *_, embedding in to_search]),
+                    limit=max_sources * 2
+                )
+                for (position, question, cache_key, embedding), search_results in zip(to_search, results_per_question):
+                    relevant_sources, early_response = self._select_sources(question, search_results, max_sources)
+                    if early_response is not None:
+                        entries[position] = early_response
+                        continue
+                    answer = partial(self._safe_answer_from_sources, question, relevant_sources,
+                                     max_sources, cache_key, embedding)
+                    # Only LLM answers are slow enough to be worth deferring
+                    entries[position] = answer if self._needs_llm(relevant_sources) else answer()
+        
+        return entries
+    
+    def _answer_from_results(self, question: str, search_results: List[SearchResult], max_sources: int,
+                             cache_key: Tuple[str, int], query_embedding: Optional[np.ndarray]) -> ChatResponse:
+        """Turn retrieved chunks into a ChatResponse and cache it when it is a full answer."""
+        relevant_sources, early_response = self._select_sources(question, search_results, max_sources)
+        if early_response is not None:
+            return early_response
+        return self._answer_from_sources(question, relevant_sources, max_sources, cache_key, query_embedding)
+    
+    def _safe_answer_from_sources(self, question: str, relevant_sources: List[SearchResult], max_sources: int,
+                                  cache_key: Tuple[str, int], query_embedding: Optional[np.ndarray]) -> ChatResponse:
+        """_answer_from_sources() for deferred batch answers, which have no caller-side error handling."""
+        try:
+            return self._answer_from_sources(question, relevant_sources, max_sources, cache_key, query_embedding)
         except Exception as e:
-            logger.error(f"Error processing question: {e}")
-            return ChatResponse(
-                answer=f"Sorry, I encountered an error while processing your question. Please try again.",
+            return self._error_response(question, e)
+    
+    def _answer_from_sources(self, question: str, relevant_sources: List[SearchResult], max_sources: int,
+                             cache_key: Tuple[str, int], query_embedding: Optional[np.ndarray]) -> ChatResponse:
+        """Generate the answer for already selected sources."""
+        llm_answer = None
+        if self._needs_llm(relevant_sources):
+            llm_answer = self._generate_llm_answer(question, relevant_sources)
+        return self._finish_answer(question, relevant_sources, max_sources, cache_key, query_embedding, llm_answer)
+    
+    def _needs_llm(self, relevant_sources: List[SearchResult]) -> bool:
+        """Whether answering from these sources takes an LLM call."""
+        return bool(self.llm) and not self._is_direct_hit(relevant_sources)
+    
+    def _finish_answer(self, question: str, relevant_sources: List[SearchResult], max_sources: int,
+                       cache_key: Tuple[str, int], query_embedding: Optional[np.ndarray],
+                       llm_answer: Optional[str]) -> ChatResponse:
+        """
+        Build the ChatResponse for already selected sources and cache it when it is a full answer.
+        
+        `llm_answer` is the LLM's text when _needs_llm() was true, or None if that call failed.
+        """
+        if self.llm and self._is_direct_hit(relevant_sources):
+            answer = self._generate_direct_answer(relevant_sources)
+            confidence = relevant_sources[0].similarity
+        elif llm_answer is not None:
+            answer = llm_answer
+            confidence = self._llm_confidence(relevant_sources)
+        else:
+            answer = self._generate_simple_answer(question, relevant_sources)
+            confidence = 0.5
+        
+        response = ChatResponse(
+            answer=answer,
+            sources=relevant_sources,
+            confidence=confidence,
+            query=question
+        )
+        # A fallback after an LLM failure is not cached, so the next ask retries the LLM
+        if llm_answer is not None or not self._needs_llm(relevant_sources):
+            self._remember_answer(cache_key, query_embedding, max_sources, response)
+        return response
+    
+    def _select_sources(self, question: str, search_results: List[SearchResult],
+                        max_sources: int) -> Tuple[List[SearchResult], Optional[ChatResponse]]:
+        """Pick the sources to answer from, or return a finished response when none are good enough."""
+        if not search_results:
+            return [], ChatResponse(
+                answer="I couldn't find any relevant information in the knowledge base to answer your question. Try asking about topics that are covered in the stored learning resources.",
                 sources=[],
                 confidence=0.0,
-                query=question,
-                error=str(e)
+                query=question
+            )
+        
+        # Milvus returns hits best-first, so the reasonably similar ones (> 0.5) are a prefix
+        relevant_sources = list(takewhile(lambda result: result.similarity > 0.5, search_results[:max_sources]))
+        
+        if not relevant_sources:
+            # Use lower threshold if no good matches
+            relevant_sources = search_results[:max_sources]
+            return relevant_sources, ChatResponse(
+                answer="I found some content that might be related to your question, but it doesn't seem directly relevant. Here's what I found:",
+                sources=relevant_sources,
+                confidence=0.3,
+                query=question
             )
+        
+        return relevant_sources, None
+    
+    @staticmethod
+    def _is_direct_hit(sources: List[SearchResult]) -> bool:
+        """Whether the best source matches so closely that an LLM answer would just reword it."""
+        return sources[0].similarity >= _DIRECT_ANSWER_SIMILARITY
+    
+    @staticmethod
+    def _generate_direct_answer(sources: List[SearchResult]) -> str:
+        """Answer with the best source's text and a citation, without calling the LLM."""
+        best = sources[0]
+        return f"{best.chunk.preview(400)}\n\nSource: {best.chunk.title}"
+    
+    @staticmethod
+    def _llm_confidence(sources: List[SearchResult]) -> float:
+        return min(0.9, max(0.6, sum(r.similarity for r in sources) / len(sources)))
     
-    def _generate_llm_answer(self, question: str, sources: List[SearchResult]) -> str:
-        """Generate an answer using the LLM based on retrieved sources."""
+    async def aask(self, question: str, max_sources: int = 3) -> ChatResponse:
+        """
+        Async counterpart of ask() for use inside request handlers.
+        
+        Produces the same ChatResponse, but embedding and search run in a worker thread and
+        the LLM is awaited asynchronously, so the event loop keeps serving other requests.
+        """
+        response = None
+        async for item in self.astream(question, max_sources):
+            if isinstance(item, ChatResponse):
+                response = item
+        return response
+    
+    async def astream(self, question: str, max_sources: int = 3) -> AsyncIterator[Union[str, ChatResponse]]:
+        """
+        Stream an answer: yields pieces of answer text as the LLM produces them, then
+        the complete ChatResponse (with sources and confidence) as the last item.
+        """
         try:
-            # Prepare context from sources
-            context_parts = []
-            for i, source in enumerate(sources, 1):
-                # Truncate very long content
-                content = source.chunk.content
-                if len(content) > 1000:
-                    content = content[:1000] + "..."
-                
-                context_parts.append(f"Source {i} - {source.chunk.title}:\n{content}\n")
+            if not question or not question.strip():
+                yield self.ask(question, max_sources)
+                return
             
-            context = "\n".join(context_parts)
+            question = question.strip()
             
-            # Create prompt template
-            prompt_template = PromptTemplate.from_template(
-                """You are a helpful AI assistant that answers questions based on learning resources. Use the following context to answer the user's question accurately and helpfully.
-
-Context from Learning Resources:
-{context}
-
-Question: {question}
-
-Instructions:
-- Provide a clear, short and concise answer based primarily on the given context
-- If referencing specific information, mention which source it comes from
-- If the context doesn't fully answer the question, be honest about limitations
-- Keep the answer focused and practical
-- Use a helpful, educational tone
-- Format your response in a readable way with proper paragraphs
-
-Answer:"""
-            )
+            # Embedding and vector search block, so run them in a worker thread
+            cache_key, query_embedding, cached = await asyncio.to_thread(self._lookup_cached, question, max_sources)
+            if cached is not None:
+                yield cached.answer
+                yield cached
+                return
             
-            # Generate response
-            prompt = prompt_template.format(context=context, question=question)
-            response = self.llm.invoke(prompt)
+            search_results = await asyncio.to_thread(self._search, question, query_embedding, max_sources)
+            
+            relevant_sources, early_response = self._select_sources(question, search_results, max_sources)
+            if early_response is not None:
+                yield early_response.answer
+                yield early_response
+                return
             
-            # Clean up the response
-            answer = str(response).strip()
-            if answer.startswith("Answer:"):
-                answer = answer[7:].strip()
+            # The LLM call is the only step that differs from ask(): here its text is streamed
+            llm_answer = None
+            if self._needs_llm(relevant_sources):
+                parts = []
+                try:
+                    async for piece in self.llm.astream(self._build_prompt(question, relevant_sources)):
+                        parts.append(piece)
+                        yield piece
+                except Exception as e:
+                    logger.error(f"Error streaming LLM answer: {e}")
+                    if parts:
+                        raise
+                if parts:
+                    llm_answer = self._clean_llm_answer("".join(parts))
             
-            return answer
+            response = self._finish_answer(question, relevant_sources, max_sources, cache_key, query_embedding, llm_answer)
+            if llm_answer is None:
+                # Direct and fallback answers have not been streamed yet
+                yield response.answer
+            yield response
             
         except Exception as e:
-            logger.error(f"Error generating LLM answer: {e}")
-            return self._generate_simple_answer(question, sources)
+            yield self._error_response(question, e)
     
-    def _generate_simple_answer(self, question: str, sources: List[SearchResult]) -> str:
-        """Generate a simple answer by combining relevant source content."""
-        answer_parts = []
-        answer_parts.append("Based on the learning resources in my knowledge base:\n")
+    def _error_response(self, question: str, error: Exception) -> ChatResponse:
+        logger.error(f"Error processing question: {error}")
+        return ChatResponse(
+            answer=f"Sorry, I encountered an error while processing your question. Please try again.",
+            sources=[],
+            confidence=0.0,
+            query=question,
+            error=str(error)
+        )
+    
+    def clear_cache(self):
+        """Forget cached answers, e.g. after new content was added to the knowledge base."""
+        with self._cache_lock:
+            self._exact_cache.clear()
+            self._semantic_embeddings = None
+            self._semantic_max_sources = np.empty(0, dtype=np.int64)
+            self._semantic_responses = []
         
-        for i, source in enumerate(sources, 1):
-            # Truncate content to most relevant part
-            content = source.chunk.content
-            if len(content) > 300:
-                content = content[:300] + "..."
-            
-            answer_parts.append(f"**{i}. From '{source.chunk.title}':**")
-            answer_parts.append(f"{content}")
-            answer_parts.append("")
+        bump_corpus_version()
+    
+    @staticmethod
+    def _normalize_question(question: str) -> str:
+        """Lowercase and collapse whitespace so trivially different questions share a cache entry."""
+        return re.sub(r'\s+', ' ', question).strip().lower()
+    
+    def _lookup_cached(self, question: str, max_sources: int
+                       ) -> Tuple[Tuple[str, int], Optional[np.ndarray], Optional[ChatResponse]]:
+        """
+        Serve repeated or paraphrased questions from the cache.
+        
+        Returns the cache key, the question's embedding (None on an exact hit or when embedding
+        fails) and the cached response for this question, if there is one.
+        """
+        cache_key = (self._normalize_question(question), max_sources)
+        cached = self._lookup_exact(cache_key)
+        if cached is not None:
+            return cache_key, None, replace(cached, query=question)
         
-        answer_parts.append("For more detailed information, please refer to the original sources.")
+        query_embedding = self._embed_question(question)
+        if query_embedding is not None:
+            cached = self._lookup_semantic(query_embedding, max_sources)
+            if cached is not None:
+                self._remember_exact(cache_key, cached)
+                return cache_key, query_embedding, replace(cached, query=question)
+        return cache_key, query_embedding, None
+    
+    def _search(self, question: str, query_embedding: Optional[np.ndarray], max_sources: int) -> List[SearchResult]:
+        """Search for relevant content, reusing the cache's embedding so the question is encoded once."""
+        if query_embedding is not None:
+            return self.vector_db.search_resources_by_embedding(query_embedding, limit=max_sources * 2)
+        return self.vector_db.search_resources(question, limit=max_sources * 2)
+    
+    def _embed_question(self, question: str) -> Optional[np.ndarray]:
+        """Embed the question for the semantic cache; None disables it for this call."""
+        try:
+            return self.vector_db.embed_query(question)
+        except Exception as e:
+            logger.warning(f"Could not embed question for the semantic cache: {e}")
+            return None
+    
+    def _lookup_exact(self, key: Tuple[str, int]) -> Optional[ChatResponse]:
+        with self._cache_lock:
+            response = self._exact_cache.get(key)
+            if response is not None:
+                self._exact_cache.move_to_end(key)
+                return response
         
-        return "\n".join(answer_parts)
+        # Fall back to answers persisted by earlier runs or other workers
+        response = _load_persisted_answer(key)
+        if response is not None:
+            self._remember_exact(key, response, persist=False)
+        return response
+    
+    def _remember_exact(self, key: Tuple[str, int], response: ChatResponse, persist: bool = True):
+        with self._cache_lock:
+            self._exact_cache[key] = response
+            self._exact_cache.move_to_end(key)
+            if len(self._exact_cache) > _EXACT_CACHE_SIZE:
+                self._exact_cache.popitem(last=False)
+        if persist:
+            _persist_answer(key, response)
+    
+    def _remember_answer(self, key: Tuple[str, int], query_embedding: Optional[np.ndarray],
+                         max_sources: int, response: ChatResponse):
+        """Cache a freshly generated answer in the exact, semantic and persistent tiers."""
+        self._remember_exact(key, response)
+        if query_embedding is not None:
+            self._remember_semantic(query_embedding, max_sources, response)
+    
+    def _lookup_semantic(self, query_embedding: np.ndarray, max_sources: int) -> Optional[ChatResponse]:
+        with self._cache_lock:
+            if self._semantic_embeddings is None:
+                return None
+            # Embeddings are unit length, so one matrix-vector product gives every cosine similarity
+            similarities = self._semantic_embeddings @ query_embedding
+            similarities[self._semantic_max_sources != max_sources] = -1.0
+            best = int(np.argmax(similarities))
+            if similarities[best] >= _SEMANTIC_CACHE_THRESHOLD:
+                return self._semantic_responses[best]
+            return None
+    
+    def _remember_semantic(self, query_embedding: np.ndarray, max_sources: int, response: ChatResponse):
+        with self._cache_lock:
+            row = query_embedding.astype(np.float32, copy=False)[np.newaxis, :]
+            if self._semantic_embeddings is None:
+                self._semantic_embeddings = row
+            else:
+                self._semantic_embeddings = np.vstack((self._semantic_embeddings, row))
+            self._semantic_max_sources = np.append(self._semantic_max_sources, max_sources)
+            self._semantic_responses.append(response)
+            
+            # Drop the oldest entries once the cache is full
+            overflow = len(self._semantic_responses) - _SEMANTIC_CACHE_SIZE
+            if overflow > 0:
+                self._semantic_embeddings = self._semantic_embeddings[overflow:]
+                self._semantic_max_sources = self._semantic_max_sources[overflow:]
+                del self._semantic_responses[:overflow]
+    
+    def _generate_llm_answer(self, question: str, sources: List[SearchResult]) -> Optional[str]:
+        """Generate an answer using the LLM based on retrieved sources; None if the LLM call fails."""
+        try:
+            # Generate response
+            response = self.llm.invoke(self._build_prompt(question, sources))
+            return self._clean_llm_answer(str(response))
+            
+        except Exception as e:
+            logger.error(f"Error generating LLM answer: {e}")
+            return None
+    
+    @staticmethod
+    def _build_prompt(question: str, sources: List[SearchResult]) -> str:
+        # Prepare context from sources, truncating very long content
+        context = "\n".join(
+            f"Source {i} - {source.chunk.title}:\n{source.chunk.preview(1000)}\n"
+            for i, source in enumerate(sources, 1)
+        )
+        return _ANSWER_PROMPT_HEAD + context + _ANSWER_PROMPT_MIDDLE + question + _ANSWER_PROMPT_TAIL
+    
+    @staticmethod
+    def _clean_llm_answer(answer: str) -> str:
+        # Clean up the response
+        answer = answer.strip()
+        if answer.startswith("Answer:"):
+            answer = answer[7:].strip()
+        return answer
+    
+    def _generate_simple_answer(self, question: str, sources: List[SearchResult]) -> str:
+        """Generate a simple answer by combining relevant source content."""
+        # One block per source, content truncated to its most relevant part
+        source_blocks = "".join(
+            f"**{i}. From '{source.chunk.title}':**\n{source.chunk.preview(300)}\n\n"
+            for i, source in enumerate(sources, 1)
+        )
+        return (
+            "Based on the learning resources in my knowledge base:\n\n"
+            + source_blocks
+            + "For more detailed information, please refer to the original sources."
+        )
 
     def get_similar_questions(self, question: str, limit: int = 3) -> List[str]:
         """Generate similar questions that might be interesting to ask."""
@@ -189,16 +530,13 @@ Answer:"""
             
             similar_questions = []
             for result in search_results:
-                # Extract key topics from the content
-                content = result.chunk.content[:200]  # First 200 chars
+                # Extract key topics from the content, lowercasing the first 200 chars once
+                content = result.chunk.content[:200].lower()
                 
                 # Generate questions based on content topics
-                if 'python' in content.lower():
-                    similar_questions.append("How do I use Python for this task?")
-                if 'tutorial' in content.lower():
-                    similar_questions.append("Can you explain this step by step?")
-                if 'example' in content.lower():
-                    similar_questions.append("Can you show me an example?")
+                similar_questions.extend(
+                    suggestion for keyword, suggestion in _SIMILAR_QUESTION_HINTS if keyword in content
+                )
                 
                 if len(similar_questions) >= limit:
                     break
@@ -207,4 +545,58 @@ Answer:"""
             
         except Exception as e:
             logger.error(f"Error generating similar questions: {e}")
-            return []
\ No newline at end of file
+            return []
+
+
+def _get_answer_cache() -> Optional[diskcache.Cache]:
+    """Open the persistent answer cache on first use; None if it is unavailable."""
+    global _answer_cache, _answer_cache_failed
+    if _answer_cache is None and not _answer_cache_failed:
+        cache_dir = os.path.join(
+            os.path.expanduser(os.getenv("LEARNERATOR_CACHE_DIR", "~/.learnerator_cache")), "rag_answers"
+        )
+        try:
+            _answer_cache = diskcache.Cache(cache_dir, size_limit=_ANSWER_CACHE_SIZE_LIMIT)
+        except Exception as e:
+            _answer_cache_failed = True
+            logger.warning(f"Persistent answer cache unavailable at {cache_dir}: {e}")
+    return _answer_cache
+
+
+def bump_corpus_version():
+    """Retire every persisted answer, e.g. after the stored content was changed or recreated."""
+    # Persisted answers are keyed by corpus version, so bumping it retires them everywhere
+    answer_cache = _get_answer_cache()
+    if answer_cache is not None:
+        try:
+            answer_cache.incr(_CORPUS_VERSION_KEY)
+        except Exception as e:
+            logger.warning(f"Could not bump corpus version in answer cache: {e}")
+
+
+def _answer_cache_key(answer_cache: diskcache.Cache, key: Tuple[str, int]) -> str:
+    """Hash a normalized question and source count together with the current corpus version."""
+    question, max_sources = key
+    corpus_version = answer_cache.get(_CORPUS_VERSION_KEY, 0)
+    return hashlib.md5(f"{question}|{max_sources}|{corpus_version}".encode()).hexdigest()
+
+
+def _load_persisted_answer(key: Tuple[str, int]) -> Optional[ChatResponse]:
+    answer_cache = _get_answer_cache()
+    if answer_cache is None:
+        return None
+    try:
+        return answer_cache.get(_answer_cache_key(answer_cache, key))
+    except Exception as e:
+        logger.warning(f"Could not read answer cache: {e}")
+        return None
+
+
+def _persist_answer(key: Tuple[str, int], response: ChatResponse):
+    answer_cache = _get_answer_cache()
+    if answer_cache is None:
+        return
+    try:
+        answer_cache.set(_answer_cache_key(answer_cache, key), response, expire=_ANSWER_CACHE_TTL_SECONDS)
+    except Exception as e:
+        logger.warning(f"Could not write answer cache: {e}")
@@ -7,6 +7,7 @@ from dataclasses import dataclass
 from urllib.parse import urlparse
 import time
 
+import numpy as np
 import requests
 from bs4 import BeautifulSoup
 from youtube_transcript_api import YouTubeTranscriptApi
@@ -39,6 +40,10 @@ class ContentChunk:
     total_chunks: int
     timestamp: float
     metadata: Dict
+    
+    def preview(self, limit: int) -> str:
+        """Return the content cut to `limit` characters, with "..." marking a cut."""
+        return self.content[:limit] + "..." if len(self.content) > limit else self.content
 
 
 @dataclass
@@ -305,6 +310,7 @@ class VectorDatabase:
         schema = CollectionSchema(fields, f"Learning resources collection")
         
         # Check if collection exists and has compatible schema
+        created = True
         if utility.has_collection(self.collection_name):
             try:
                 self.collection = Collection(self.collection_name)
@@ -319,6 +325,7 @@ class VectorDatabase:
                     self.collection = Collection(self.collection_name, schema)
                     logger.info(f"Created new collection with updated schema: {self.collection_name}")
                 else:
+                    created = False
                     logger.info(f"Loaded existing collection: {self.collection_name}")
                     
             except Exception as e:
@@ -331,13 +338,27 @@ class VectorDatabase:
             self.collection = Collection(self.collection_name, schema)
             logger.info(f"Created new collection: {self.collection_name}")
         
+        if created:
+            # Answers persisted by earlier runs cite chunks that are now gone
+            from .rag_chatbot import bump_corpus_version
+            bump_corpus_version()
+        
         # Create index on embedding field
+        # IVF_SQ8 stores each vector component as one byte instead of a float32,
+        # cutting index memory ~4x with a negligible loss in cosine recall
         index_params = {
             "metric_type": "COSINE",
-            "index_type": "IVF_FLAT",
+            "index_type": "IVF_SQ8",
             "params": {"nlist": 128}
         }
         
+        if self.collection.has_index():
+            existing_type = self.collection.index().params.get("index_type")
+            if existing_type != index_params["index_type"]:
+                logger.info(f"Rebuilding {existing_type} index as {index_params['index_type']}")
+                self.collection.release()
+                self.collection.drop_index()
+        
         if not self.collection.has_index():
             self.collection.create_index("embedding", index_params)
             logger.info("Created index on embedding field")
@@ -439,54 +460,72 @@ class VectorDatabase:
             logger.error(f"Error adding content to database: {e}")
             return False
         
+    def embed_query(self, query: str) -> np.ndarray:
+        """Embed a query as a unit-length float32 vector."""
+        return self.model.encode(query, normalize_embeddings=True)
+    
+    def embed_queries(self, queries: List[str]) -> np.ndarray:
+        """Embed several queries in one model call; one unit-length row per query."""
+        return self.model.encode(queries, normalize_embeddings=True)
+    
     def search(self, query: str, top_k: int = 10) -> List[SearchResult]:
         """Search for similar content using vector similarity."""
         try:
             # Generate query embedding
-            query_embedding = self.model.encode(query).tolist()
-            
-            # Search parameters
-            search_params = {
-                "metric_type": "COSINE",
-                "params": {"nprobe": 10}
-            }
-            
-            # Perform search
-            results = self.collection.search(
-                data=[query_embedding],
-                anns_field="embedding",
-                param=search_params,
-                limit=top_k,
-                output_fields=["content", "source_url", "content_type", "title", 
-                              "chunk_index", "total_chunks", "timestamp", "metadata"]
-            )
-            
-            # Convert to SearchResult objects
-            search_results = []
-            for hit in results[0]:
-                chunk = ContentChunk(
-                    id=hit.id,
-                    content=hit.entity.get("content"),
-                    source_url=hit.entity.get("source_url"),
-                    content_type=hit.entity.get("content_type"),
-                    title=hit.entity.get("title"),
-                    chunk_index=hit.entity.get("chunk_index"),
-                    total_chunks=hit.entity.get("total_chunks"),
-                    timestamp=hit.entity.get("timestamp"),
-                    metadata=json.loads(hit.entity.get("metadata", "{}"))
-                )
-                
-                search_results.append(SearchResult(
-                    chunk=chunk,
-                    similarity=hit.score
-                ))
-            
-            return search_results
+            query_embedding = self.model.encode(query)
+            return self._search_embeddings([query_embedding], top_k)[0]
             
         except Exception as e:
             logger.error(f"Error searching database: {e}")
             return []
     
+    def search_by_embeddings(self, query_embeddings: np.ndarray, top_k: int = 10) -> List[List[SearchResult]]:
+        """Search for several already-embedded queries in a single Milvus request."""
+        try:
+            return self._search_embeddings(query_embeddings, top_k)
+        except Exception as e:
+            logger.error(f"Error searching database: {e}")
+            return [[] for _ in range(len(query_embeddings))]
+    
+    def _search_embeddings(self, query_embeddings, top_k: int) -> List[List[SearchResult]]:
+        # Search parameters
+        search_params = {
+            "metric_type": "COSINE",
+            "params": {"nprobe": 10}
+        }
+        
+        # Perform search
+        results = self.collection.search(
+            data=[np.asarray(embedding).tolist() for embedding in query_embeddings],
+            anns_field="embedding",
+            param=search_params,
+            limit=top_k,
+            output_fields=["content", "source_url", "content_type", "title", 
+                          "chunk_index", "total_chunks", "timestamp", "metadata"]
+        )
+        
+        # Convert to SearchResult objects, one list per query
+        return [[self._to_search_result(hit) for hit in hits] for hits in results]
+    
+    @staticmethod
+    def _to_search_result(hit) -> SearchResult:
+        chunk = ContentChunk(
+            id=hit.id,
+            content=hit.entity.get("content"),
+            source_url=hit.entity.get("source_url"),
+            content_type=hit.entity.get("content_type"),
+            title=hit.entity.get("title"),
+            chunk_index=hit.entity.get("chunk_index"),
+            total_chunks=hit.entity.get("total_chunks"),
+            timestamp=hit.entity.get("timestamp"),
+            metadata=json.loads(hit.entity.get("metadata", "{}"))
+        )
+        
+        return SearchResult(
+            chunk=chunk,
+            similarity=hit.score
+        )
+    
     def get_all_content(self) -> List[ContentChunk]:
         """Get all content from the database."""
         try:
@@ -568,14 +607,24 @@ class LearningResourceVectorDB:
         # Initialize chatbot if needed (optional dependency)
         try:
             from .rag_chatbot import RAGChatbot
-            self.chatbot = RAGChatbot(self.vector_db)
+            self.chatbot = RAGChatbot(self)
             logger.info("RAG Chatbot initialized successfully")
         except ImportError:
             logger.info("RAG Chatbot not available (optional)")
             self.chatbot = None
         
+        self.warm_up()
         logger.info("Learning Resource Vector Database initialized successfully")
     
+    def warm_up(self):
+        """Run one throwaway encode so the first real query doesn't pay the model's lazy setup."""
+        try:
+            start = time.time()
+            self.vector_db.embed_queries(["warmup"])
+            logger.info(f"Embedding model warmed up in {time.time() - start:.2f}s")
+        except Exception as e:
+            logger.warning(f"Embedding model warm-up failed: {e}")
+    
     def process_urls(self, urls: List[str]) -> Dict:
         """Process a list of URLs and add to vector database."""
         results = {
@@ -631,6 +680,8 @@ class LearningResourceVectorDB:
                     'error': str(e)
                 })
         
+        if results['processed']:
+            self._content_changed()
         return results
     
     def add_resource(self, url: str, title: str = None) -> bool:
@@ -653,6 +704,7 @@ class LearningResourceVectorDB:
                 success = self.vector_db.add_content(content_data)
                 if success:
                     logger.info(f"Successfully added: {content_data['title']}")
+                    self._content_changed()
                 return success
             else:
                 logger.warning(f"Could not extract content from {url}")
@@ -662,6 +714,19 @@ class LearningResourceVectorDB:
             logger.error(f"Error adding resource {url}: {e}")
             return False
         
+    def embed_query(self, query: str) -> np.ndarray:
+        """Embed a query with the same model used for stored content."""
+        return self.vector_db.embed_query(query)
+    
+    def embed_queries(self, queries: List[str]) -> np.ndarray:
+        """Embed several queries in one model call."""
+        return self.vector_db.embed_queries(queries)
+    
+    def _content_changed(self):
+        """Drop cached chatbot answers once the knowledge base has new content."""
+        if self.chatbot:
+            self.chatbot.clear_cache()
+    
     def search_resources(self, query: str, limit: int = 10) -> List[SearchResult]:
         """Search for resources based on a query."""
         try:
@@ -673,6 +738,15 @@ class LearningResourceVectorDB:
             logger.error(f"Error searching resources: {e}")
             return []
     
+    def search_resources_by_embedding(self, query_embedding: np.ndarray, limit: int = 10) -> List[SearchResult]:
+        """Search for resources with an already-computed query embedding (see embed_query)."""
+        return self.search_resources_by_embeddings(query_embedding[np.newaxis, :], limit)[0]
+    
+    def search_resources_by_embeddings(self, query_embeddings: np.ndarray, limit: int = 10) -> List[List[SearchResult]]:
+        """Search for several already-embedded queries at once; one result list per query."""
+        logger.info(f"Searching resources for {len(query_embeddings)} queries")
+        return self.vector_db.search_by_embeddings(query_embeddings, limit)
+    
     def add_content(self, content: str, metadata: Dict) -> bool:
         """Add content directly with metadata."""
         content_data = {
@@ -682,4 +756,7 @@ class LearningResourceVectorDB:
             'content_type': metadata.get('source_type', 'manual'),
             'metadata': metadata
         }
-        return self.vector_db.add_content(content_data)
+        success = self.vector_db.add_content(content_data)
+        if success:
+            self._content_changed()
+        return success
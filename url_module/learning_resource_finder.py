@@ -5,13 +5,26 @@ A tool for finding educational resources including basics tutorials and demonstr
 for any given topic and project purpose. Designed to be used by agentic LLMs.
 """
 
+import copy
+import hashlib
 import json
+import logging
 import os
 import re
+import sys
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing, contextmanager
+from functools import lru_cache
 from typing import Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
 
+import diskcache
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
+from googleapiclient.http import build_http
 from langchain_together import Together
 from langchain_core.prompts import PromptTemplate
 from dotenv import load_dotenv
@@ -20,6 +33,114 @@ from utils.schema import SearchConfig, ResourceSources, SearchResult
 # Load environment variables
 load_dotenv()
 
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Strips list brackets from learning content before splitting
+_BRACKET_TRANS = str.maketrans('', '', '[]')
+
+# Shared decoder for pulling the sources object out of free-form LLM text
+_JSON_DECODER = json.JSONDecoder()
+
+# Result-scoring term sets, compiled once so each check is a single C-level scan
+_EXCLUDED_URL_TERMS = re.compile('login|signup|pay|subscribe')
+_TUTORIAL_TERMS = re.compile('tutorial|guide|learn|how to')
+_VIDEO_TUTORIAL_TERMS = re.compile('tutorial|example|demo|guide|how to')
+
+
+@lru_cache(maxsize=256)
+def _parse_learning_content_cached(content: str) -> Tuple[str, ...]:
+    """Split learning content into topics, memoized for repeated inputs."""
+    # Handles "[item1, item2]", "item1, item2" and a single topic in one pass.
+    # Topics are interned since they recur across calls and key the coverage dicts
+    topics = (topic.strip() for topic in content.translate(_BRACKET_TRANS).split(','))
+    return tuple(sys.intern(topic) for topic in topics if topic)
+
+
+def _website_domain(website: str) -> str:
+    """Return the host part of a website given with or without a scheme."""
+    try:
+        domain = urlsplit(website if '//' in website else '//' + website).netloc
+    except ValueError:
+        domain = ''
+    return domain or website.split('/', 1)[0]
+
+
+@lru_cache(maxsize=256)
+def _topic_keyword_pattern(specific_topic: str) -> Optional[re.Pattern]:
+    """Compile a matcher for any keyword of a specific topic."""
+    keywords = specific_topic.lower().split()
+    if not keywords:
+        return None
+    return re.compile('|'.join(map(re.escape, keywords)))
+
+
+def _is_rate_limit_error(error: HttpError) -> bool:
+    """Check whether a Google API error means the quota or rate limit was hit."""
+    status = getattr(error.resp, 'status', None)
+    return status == 429 or "rateLimitExceeded" in str(error) or "Quota exceeded" in str(error)
+
+
+class _AdaptiveSearchLimiter:
+    """
+    Bounds concurrent Custom Search calls and backs off when Google pushes back.
+    
+    Rate-limit errors halve the calls allowed in flight and double the delay
+    before each call; every run of successes restores one permit and shortens
+    the delay by one step (AIMD).
+    """
+    
+    def __init__(self, max_permits: int, success_streak: int = 5,
+                 delay_step: float = 0.25, max_delay: float = 8.0):
+        self._max_permits = max(1, max_permits)
+        self._permits = self._max_permits
+        self._in_flight = 0
+        self._success_streak = success_streak
+        self._successes = 0
+        self._delay_step = delay_step
+        self._max_delay = max_delay
+        self._delay = 0.0
+        self._condition = threading.Condition()
+    
+    @contextmanager
+    def slot(self):
+        """Hold one search permit for the duration of the block."""
+        with self._condition:
+            while self._in_flight >= self._permits:
+                self._condition.wait()
+            self._in_flight += 1
+            delay = self._delay
+        
+        try:
+            if delay:
+                time.sleep(delay)
+            yield
+        finally:
+            with self._condition:
+                self._in_flight -= 1
+                self._condition.notify_all()
+    
+    def record_success(self) -> None:
+        """Additively restore capacity after a streak of successful calls."""
+        with self._condition:
+            self._successes += 1
+            if self._successes < self._success_streak:
+                return
+            self._successes = 0
+            self._permits = min(self._max_permits, self._permits + 1)
+            self._delay = max(0.0, self._delay - self._delay_step)
+            self._condition.notify_all()
+    
+    def record_rate_limited(self) -> None:
+        """Multiplicatively cut capacity after a rate-limit response."""
+        with self._condition:
+            self._successes = 0
+            self._permits = max(1, self._permits // 2)
+            self._delay = min(self._max_delay, max(self._delay_step, self._delay * 2))
+            logger.warning("⚠️ Search rate limited, lowering concurrency to %d with %.2fs delay",
+                           self._permits, self._delay)
+
 
 class LearningResourceFinder:
     """
@@ -33,6 +154,11 @@ class LearningResourceFinder:
     def __init__(self, config: Optional[SearchConfig] = None):
         """Initialize the learning resource finder."""
         self.config = config or SearchConfig()
+        self._thread_state = threading.local()
+        # Long-lived so each worker's HTTP connection (see _execute_search) is reused across requests
+        self._search_executor = ThreadPoolExecutor(max_workers=max(1, self.config.max_concurrent_searches),
+                                                   thread_name_prefix="cse-search")
+        self._search_limiter = _AdaptiveSearchLimiter(self.config.max_concurrent_searches)
         self._load_api_credentials()
         self._initialize_services()
     
@@ -45,128 +171,81 @@ class LearningResourceFinder:
     def _initialize_services(self) -> None:
         """Initialize external services."""
         try:
-            self.llm = Together(
-                model="mistralai/Mixtral-8x7B-Instruct-v0.1",
-                together_api_key=self.together_api_key,
-                max_tokens=self.config.llm_max_tokens
-            )
+            self.llm = _get_llm(self.together_api_key, self.config.llm_max_tokens)
             
-            self.search_service = build('customsearch', 'v1', developerKey=self.google_api_key)
+            self.search_service = _get_cse_service(self.google_api_key)
         except Exception as e:
-            print(f"⚠️ Failed to initialize services: {e}")
-            print("🔄 Will use mock data for search results")
+            logger.warning("⚠️ Failed to initialize services: %s", e)
+            logger.warning("🔄 Will use mock data for search results")
     
-    def _parse_learning_content(self, content: str) -> List[str]:
+    @staticmethod
+    def _parse_learning_content(content: str) -> List[str]:
         """Parse learning content into individual topics/features."""
         if isinstance(content, list):
             return content
         
-        # Handle bracketed list format: [item1, item2, item3]
-        if content.strip().startswith('[') and content.strip().endswith(']'):
-            content = content.strip()[1:-1]  # Remove brackets
-            topics = [topic.strip() for topic in content.split(',')]
-            return [topic for topic in topics if topic]
-        
-        # Handle comma-separated format
-        if ',' in content:
-            topics = [topic.strip() for topic in content.split(',')]
-            return [topic for topic in topics if topic]
-        
-        # Single topic
-        return [content.strip()] if content.strip() else []
+        return list(_parse_learning_content_cached(content))
 
     def _query_llm_for_sources(self, topic: str, learning_content: List[str]) -> ResourceSources:
         """Query LLM for recommended learning sources."""
         content_list = ", ".join(learning_content)
-        prompt_template = PromptTemplate.from_template(
-            """
-            What are the TOP 3 best free tutorial websites and TOP 2 YouTube channels to learn {topic}? 
-            I specifically need to learn these topics/features: {learning_content}
-            
-            IMPORTANT: Return only the BEST 3 websites and BEST 2 YouTube channels.
-            
-            I need:
-            1. TOP 3 tutorial websites (like MDN, javascript.info, GeeksforGeeks) with the most comprehensive coverage
-            2. TOP 2 YouTube channels with the best practical demonstrations
-            
-            Focus on the highest quality resources that cover: {learning_content}
-            
-            Exclude course-based platforms like Coursera, edX, or Khan Academy. 
-            Return EXACTLY 3 websites and 2 YouTube channels in JSON format.
-            
-            Example format:
-            {{
-                "websites": ["developer.mozilla.org", "javascript.info", "freecodecamp.org"],
-                "youtube_channels": ["youtube.com/@TraversyMedia", "youtube.com/@CodeWithMosh"]
-            }}
-            """
-        )
         
         try:
-            prompt = prompt_template.format(topic=topic, learning_content=content_list)
-            response = self.llm.invoke(prompt)
-            
-            # Parse JSON from response
-            sources_data = self._extract_json_from_response(str(response))
+            websites, youtube_channels = _query_llm_for_sources_cached(
+                self.together_api_key, self.config.llm_max_tokens, topic, content_list
+            )
             
             return ResourceSources(
-                websites=sources_data.get('websites', []),
-                youtube_channels=sources_data.get('youtube_channels', [])
+                websites=list(websites),
+                youtube_channels=list(youtube_channels)
             )
             
         except Exception as e:
-            print(f"LLM query error: {e}")
+            logger.error("LLM query error: %s", e)
             # Return focused fallback sources - only the best 2-3 sites
             return ResourceSources(
                 websites=['developer.mozilla.org', 'freecodecamp.org'],  # Reduced to top 2
                 youtube_channels=['youtube.com/@TraversyMedia', 'youtube.com/@CodeWithMosh']
             )
     
-    def _extract_json_from_response(self, response_text: str) -> Dict:
+    @staticmethod
+    def _extract_json_from_response(response_text: str) -> Dict:
         """Extract JSON data from LLM response text."""
-        try:
-            # Look for all JSON blocks in the response
-            json_blocks = re.findall(r'\{[^{}]*(?:\{[^{}]*\}[^{}]*)*\}', response_text)
-            
-            # Try to parse each JSON block until we find a valid one
-            for json_str in json_blocks:
-                try:
-                    sources = json.loads(json_str)
-                    if 'websites' in sources or 'youtube_channels' in sources:
-                        return sources
-                except json.JSONDecodeError:
-                    continue
-            
-            raise json.JSONDecodeError("No valid JSON found", response_text, 0)
-            
-        except json.JSONDecodeError:
-            print(f"Error: LLM response is not valid JSON: {response_text}")
+        sources = LearningResourceFinder._find_sources_json(response_text)
+        if sources is None:
+            logger.error("Error: LLM response is not valid JSON: %s", response_text)
             return {'websites': [], 'youtube_channels': []}
+        return sources
+    
+    @staticmethod
+    def _find_sources_json(response_text: str) -> Optional[Dict]:
+        """Return the first complete sources object in the text, if any."""
+        # Decode candidate objects in place from each opening brace, so the
+        # common case parses the response once with no regex pre-scan
+        start = response_text.find('{')
+        while start != -1:
+            try:
+                sources, _ = _JSON_DECODER.raw_decode(response_text, start)
+                if isinstance(sources, dict) and ('websites' in sources or 'youtube_channels' in sources):
+                    return sources
+            except json.JSONDecodeError:
+                pass
+            start = response_text.find('{', start + 1)
+        return None
     
     def _extract_domains(self, sources: ResourceSources) -> Tuple[List[str], List[str]]:
         """Extract and process domains from LLM sources."""
-        # Process website domains
-        key_domains = []
-        for website in sources.websites[:self.config.max_websites]:
-            if isinstance(website, str):
-                domain = website.replace('https://', '').replace('http://', '').split('/')[0]
-                key_domains.append(domain)
-        
-        # Process YouTube channels
-        youtube_channels = []
-        for channel in sources.youtube_channels[:self.config.max_youtube_channels]:
-            if isinstance(channel, str) and 'youtube.com' in channel:
-                youtube_channels.append(channel)
-        
-        # Add focused fallback domains - only the most reliable ones
-        fallback_domains = ['developer.mozilla.org', 'freecodecamp.org']  # Reduced to top 2
-        for domain in fallback_domains:
-            if len(key_domains) >= self.config.max_domains:
-                break
-            if domain not in key_domains:
-                key_domains.append(domain)
+        websites = tuple(
+            website for website in sources.websites[:self.config.max_websites]
+            if isinstance(website, str)
+        )
+        youtube_channels = tuple(
+            channel for channel in sources.youtube_channels[:self.config.max_youtube_channels]
+            if isinstance(channel, str)
+        )
         
-        return list(dict.fromkeys(key_domains))[:self.config.max_domains], youtube_channels
+        key_domains, youtube_domains = _extract_domains_cached(websites, youtube_channels, self.config.max_domains)
+        return list(key_domains), list(youtube_domains)
     
     # def _search_basics_tutorial(self, topic: str, domains: List[str]) -> Optional[str]:
     #     """Search for a basics/introduction tutorial."""
@@ -240,38 +319,81 @@ class LearningResourceFinder:
         
     #     return None
     
-    def _search_specific_topics(self, topic: str, learning_content: List[str], domains: List[str], youtube_channels: List[str]) -> Dict[str, List[str]]:
+    def _search_specific_topics(self, topic: str, learning_content: List[str], domains: List[str], youtube_domains: List[str],
+                                max_results: Optional[int] = None) -> Dict[str, List[str]]:
         """Search for resources covering specific topics/features - one dedicated resource per topic."""
+        specific_topics = list(dict.fromkeys(learning_content))
+        if not specific_topics:
+            return {}
+        
+        # Each topic contributes at most one URL, so once max_results topics are
+        # covered the rest cannot be returned. Search in waves sized to the
+        # shortfall and stop early; when every topic fits this is a single wave.
+        target = len(specific_topics) if max_results is None else min(max_results, len(specific_topics))
         topic_coverage = {}
+        covered = 0
+        next_index = 0
         
-        for specific_topic in learning_content:
-            topic_coverage[specific_topic] = []
-            
-            # First try to find a dedicated tutorial page for this specific topic
-            tutorial_url = self._search_dedicated_tutorial(topic, specific_topic, domains)
-            if tutorial_url:
-                topic_coverage[specific_topic].append(tutorial_url)
-                continue
+        # Each topic's searches are independent, so submit a whole wave at once
+        # instead of waiting on one network round trip after another
+        while covered < target and next_index < len(specific_topics):
+            wave = specific_topics[next_index:next_index + target - covered]
+            next_index += len(wave)
             
-            # If no dedicated tutorial found, try YouTube
-            youtube_url = self._search_youtube_for_topic(topic, specific_topic, youtube_channels)
-            if youtube_url:
-                topic_coverage[specific_topic].append(youtube_url)
-                continue
+            coverage = self._search_executor.map(
+                lambda specific_topic: self._search_topic(topic, specific_topic, domains, youtube_domains),
+                wave
+            )
+            for specific_topic, topic_urls in zip(wave, coverage):
+                topic_coverage[specific_topic] = topic_urls
+                if topic_urls:
+                    covered += 1
         
         return topic_coverage
 
+    def _search_topic(self, topic: str, specific_topic: str, domains: List[str], youtube_domains: List[str]) -> List[str]:
+        """Find one dedicated resource for a specific topic, preferring tutorial pages."""
+        # First try to find a dedicated tutorial page for this specific topic
+        tutorial_url = self._search_dedicated_tutorial(topic, specific_topic, domains)
+        if tutorial_url:
+            return [tutorial_url]
+        
+        # If no dedicated tutorial found, try YouTube
+        youtube_url = self._search_youtube_for_topic(topic, specific_topic, youtube_domains)
+        if youtube_url:
+            return [youtube_url]
+        
+        return []
+
+    def _execute_search(self, query: str, num: int) -> Dict:
+        """Run a Custom Search query on the calling thread's own HTTP connection."""
+        # httplib2 connections are not thread-safe, so each worker keeps its own
+        http = getattr(self._thread_state, 'http', None)
+        if http is None:
+            http = self._thread_state.http = build_http()
+        
+        with self._search_limiter.slot():
+            try:
+                result = self.search_service.cse().list(
+                    q=query,
+                    cx=self.cse_id,
+                    num=num
+                ).execute(http=http)
+            except HttpError as e:
+                if _is_rate_limit_error(e):
+                    self._search_limiter.record_rate_limited()
+                raise
+        
+        self._search_limiter.record_success()
+        return result
+
     def _search_dedicated_tutorial(self, topic: str, specific_topic: str, domains: List[str]) -> Optional[str]:
         """Search for a dedicated tutorial page for a specific topic."""
         for domain in domains:
             query = f'"{specific_topic}" {topic} tutorial guide site:{domain}'
             
             try:
-                result = self.search_service.cse().list(
-                    q=query,
-                    cx=self.cse_id,
-                    num=3
-                ).execute()
+                result = self._execute_search(query, num=3)
                 
                 if 'items' in result:
                     for item in result['items']:
@@ -280,28 +402,22 @@ class LearningResourceFinder:
                         snippet = item.get('snippet', '').lower()
                         
                         if url and self._is_dedicated_tutorial(url, title, snippet, specific_topic):
-                            print(f"Found dedicated tutorial for '{specific_topic}': {url}")
+                            logger.info("Found dedicated tutorial for '%s': %s", specific_topic, url)
                             return url
                             
             except HttpError as e:
-                print(f"Search error for {specific_topic} tutorial on {domain}: {e}")
+                logger.warning("Search error for %s tutorial on %s: %s", specific_topic, domain, e)
                 continue
         
         return None
 
-    def _search_youtube_for_topic(self, topic: str, specific_topic: str, youtube_channels: List[str]) -> Optional[str]:
+    def _search_youtube_for_topic(self, topic: str, specific_topic: str, youtube_domains: List[str]) -> Optional[str]:
         """Search for a YouTube video dedicated to a specific topic."""
-        youtube_domains = [domain for domain in youtube_channels if 'youtube.com' in domain] + ['youtube.com']
-        
         for domain in youtube_domains[:2]:  # Limit to avoid too many API calls
             query = f'"{specific_topic}" {topic} tutorial example site:{domain}'
             
             try:
-                result = self.search_service.cse().list(
-                    q=query,
-                    cx=self.cse_id,
-                    num=3
-                ).execute()
+                result = self._execute_search(query, num=3)
                 
                 if 'items' in result:
                     for item in result['items']:
@@ -310,39 +426,36 @@ class LearningResourceFinder:
                         snippet = item.get('snippet', '').lower()
                         
                         if url and self._is_dedicated_youtube_video(url, title, snippet, specific_topic):
-                            print(f"Found YouTube video for '{specific_topic}': {url}")
+                            logger.info("Found YouTube video for '%s': %s", specific_topic, url)
                             return url
                             
             except HttpError as e:
-                print(f"Search error for {specific_topic} YouTube on {domain}: {e}")
+                logger.warning("Search error for %s YouTube on %s: %s", specific_topic, domain, e)
                 continue
         
         return None
 
     def _is_dedicated_tutorial(self, url: str, title: str, snippet: str, specific_topic: str) -> bool:
         """Check if a URL is a dedicated tutorial for the specific topic."""
-        excluded_terms = ['login', 'signup', 'pay', 'subscribe']
-        topic_keywords = specific_topic.lower().split()
+        topic_pattern = _topic_keyword_pattern(specific_topic)
         
         # Check if the specific topic appears prominently in title or snippet
-        topic_in_title = any(keyword in title for keyword in topic_keywords)
-        topic_in_snippet = any(keyword in snippet for keyword in topic_keywords)
-        is_tutorial = any(term in title or term in snippet for term in ['tutorial', 'guide', 'learn', 'how to'])
-        is_clean_url = all(term not in url.lower() for term in excluded_terms)
+        topic_mentioned = topic_pattern is not None and bool(topic_pattern.search(title) or topic_pattern.search(snippet))
+        is_tutorial = bool(_TUTORIAL_TERMS.search(title) or _TUTORIAL_TERMS.search(snippet))
+        is_clean_url = not _EXCLUDED_URL_TERMS.search(url.lower())
         is_not_youtube = 'youtube.com' not in url
         
-        return (topic_in_title or topic_in_snippet) and is_tutorial and is_clean_url and is_not_youtube
+        return topic_mentioned and is_tutorial and is_clean_url and is_not_youtube
 
     def _is_dedicated_youtube_video(self, url: str, title: str, snippet: str, specific_topic: str) -> bool:
         """Check if a URL is a dedicated YouTube video for the specific topic."""
-        excluded_terms = ['login', 'signup', 'pay', 'subscribe']
-        topic_keywords = specific_topic.lower().split()
+        topic_pattern = _topic_keyword_pattern(specific_topic)
         
         # Check if the specific topic appears in title or snippet
-        topic_mentioned = any(keyword in title or keyword in snippet for keyword in topic_keywords)
+        topic_mentioned = topic_pattern is not None and bool(topic_pattern.search(title) or topic_pattern.search(snippet))
         is_youtube = 'youtube.com' in url and '/watch' in url
-        is_tutorial = any(term in title or term in snippet for term in ['tutorial', 'example', 'demo', 'guide', 'how to'])
-        is_clean_url = all(term not in url.lower() for term in excluded_terms)
+        is_tutorial = bool(_VIDEO_TUTORIAL_TERMS.search(title) or _VIDEO_TUTORIAL_TERMS.search(snippet))
+        is_clean_url = not _EXCLUDED_URL_TERMS.search(url.lower())
         
         return topic_mentioned and is_youtube and is_tutorial and is_clean_url
     
@@ -394,17 +507,16 @@ class LearningResourceFinder:
             else:
                 raise ValueError("Invalid input format. Expected string or dict.")
                 
-            print(f"Learning topic: {topic}")
-            print(f"Learning objectives: {learning_content}")
+            logger.info("Learning topic: %s\nLearning objectives: %s", topic, learning_content)
             
             # Step 2: Get recommended sources from LLM
             sources = self._query_llm_for_sources(topic, learning_content)
             
             # Step 3: Extract and process domains
-            domains, youtube_channels = self._extract_domains(sources)
+            domains, youtube_domains = self._extract_domains(sources)
             
             # Step 4: Search for resources covering specific topics (one per topic)
-            topic_coverage = self._search_specific_topics(topic, learning_content, domains, youtube_channels)
+            topic_coverage = self._search_specific_topics(topic, learning_content, domains, youtube_domains, max_results)
             
             # Step 5: Collect URLs ensuring one resource per topic and good balance
             urls = []
@@ -425,22 +537,24 @@ class LearningResourceFinder:
                     else:
                         tutorial_urls.append(url)
             
-            # Validate results and report
-            has_basics = any('youtube.com' not in url for url in urls)
-            has_youtube = any('youtube.com' in url for url in urls)
+            # Validate results and report, reusing the categorization above
+            youtube_count = len(youtube_urls)
+            tutorial_count = len(tutorial_urls)
+            has_basics = tutorial_count > 0
+            has_youtube = youtube_count > 0
             
-            youtube_count = len([url for url in urls if 'youtube.com' in url])
-            tutorial_count = len([url for url in urls if 'youtube.com' not in url])
-            
-            print(f"✅ Found {len(urls)} URLs covering {len(covered_topics)}/{len(learning_content)} learning objectives")
-            print(f"📺 YouTube videos: {youtube_count}, 📖 Tutorial pages: {tutorial_count}")
-            print(f"🎯 Covered topics: {covered_topics}")
-            
-            missing_topics = [t for t in learning_content if t not in covered_topics]
-            if missing_topics:
-                print(f"⚠️ Missing coverage for: {missing_topics}")
-            else:
-                print(f"🎉 All topics covered!")
+            # Report the whole search in one record, built only when INFO is enabled
+            if logger.isEnabledFor(logging.INFO):
+                covered_set = set(covered_topics)
+                missing_topics = [t for t in learning_content if t not in covered_set]
+                coverage_note = f"⚠️ Missing coverage for: {missing_topics}" if missing_topics else "🎉 All topics covered!"
+                logger.info(
+                    "✅ Found %d URLs covering %d/%d learning objectives\n"
+                    "📺 YouTube videos: %d, 📖 Tutorial pages: %d\n"
+                    "🎯 Covered topics: %s\n%s",
+                    len(urls), len(covered_topics), len(learning_content),
+                    youtube_count, tutorial_count, covered_topics, coverage_note
+                )
             
             return SearchResult(
                 urls=urls,
@@ -452,12 +566,131 @@ class LearningResourceFinder:
             )
             
         except HttpError as e:
-            error_msg = f"Google API error: {e}"
-            print(f"⚠️ {error_msg}")
+            logger.warning("⚠️ Google API error: %s", e)
         
         except Exception as e:
-            error_msg = f"Unexpected error: {e}"
-            print(f"⚠️ {error_msg}")
+            logger.warning("⚠️ Unexpected error: %s", e)
+
+
+# Memoized helpers shared by every finder instance, so repeated requests for the
+# same topic within a process skip the LLM round trip entirely
+_SOURCES_PROMPT = PromptTemplate.from_template(
+    """
+    What are the TOP 3 best free tutorial websites and TOP 2 YouTube channels to learn {topic}? 
+    I specifically need to learn these topics/features: {learning_content}
+    
+    IMPORTANT: Return only the BEST 3 websites and BEST 2 YouTube channels.
+    
+    I need:
+    1. TOP 3 tutorial websites (like MDN, javascript.info, GeeksforGeeks) with the most comprehensive coverage
+    2. TOP 2 YouTube channels with the best practical demonstrations
+    
+    Focus on the highest quality resources that cover: {learning_content}
+    
+    Exclude course-based platforms like Coursera, edX, or Khan Academy. 
+    Return EXACTLY 3 websites and 2 YouTube channels in JSON format.
+    
+    Example format:
+    {{
+        "websites": ["developer.mozilla.org", "javascript.info", "freecodecamp.org"],
+        "youtube_channels": ["youtube.com/@TraversyMedia", "youtube.com/@CodeWithMosh"]
+    }}
+    """
+)
+
+
+@lru_cache(maxsize=4)
+def _get_llm(together_api_key: Optional[str], max_tokens: int) -> Together:
+    """Create the Together LLM client once per key and token budget."""
+    return Together(
+        model="mistralai/Mixtral-8x7B-Instruct-v0.1",
+        together_api_key=together_api_key,
+        max_tokens=max_tokens
+    )
+
+
+@lru_cache(maxsize=1)
+def _get_cse_service(google_api_key: Optional[str]):
+    """Build the Custom Search client once, from the bundled discovery document."""
+    return build('customsearch', 'v1', developerKey=google_api_key,
+                 cache_discovery=False, static_discovery=True)
+
+
+@lru_cache(maxsize=256)
+def _query_llm_for_sources_cached(together_api_key: Optional[str], max_tokens: int,
+                                  topic: str, content_list: str) -> Tuple[Tuple, Tuple]:
+    """
+    Ask the LLM for recommended websites and YouTube channels.
+    
+    Raises when the LLM fails or returns no usable sources, so that only
+    good answers are cached and a retry gets a fresh LLM call.
+    """
+    prompt = _SOURCES_PROMPT.format(topic=topic, learning_content=content_list)
+    
+    # Stream the response and stop as soon as a complete sources object has
+    # arrived, instead of waiting for the model to finish generating
+    response_parts = []
+    sources_data = None
+    with closing(_get_llm(together_api_key, max_tokens).stream(prompt)) as stream:
+        for chunk in stream:
+            response_parts.append(chunk)
+            if '}' in chunk:
+                sources_data = LearningResourceFinder._find_sources_json(''.join(response_parts))
+                if sources_data is not None:
+                    break
+    
+    if sources_data is None:
+        sources_data = LearningResourceFinder._extract_json_from_response(''.join(response_parts))
+    websites = tuple(sources_data.get('websites', []))
+    youtube_channels = tuple(sources_data.get('youtube_channels', []))
+    if not websites and not youtube_channels:
+        raise ValueError("LLM returned no recommended sources")
+    
+    return websites, youtube_channels
+
+
+@lru_cache(maxsize=128)
+def _extract_domains_cached(websites: Tuple[str, ...], youtube_channels: Tuple[str, ...],
+                            max_domains: int) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+    """Turn recommended websites and channels into search domains."""
+    # Process website domains, deduplicating as we go
+    key_domains = []
+    seen_domains = set()
+    for website in websites:
+        domain = _website_domain(website)
+        if domain not in seen_domains:
+            seen_domains.add(domain)
+            key_domains.append(domain)
+    
+    # Process YouTube channels into the search domains, with youtube.com as the catch-all
+    youtube_domains = [channel for channel in youtube_channels if 'youtube.com' in channel]
+    youtube_domains.append('youtube.com')
+    
+    # Add focused fallback domains - only the most reliable ones
+    fallback_domains = ['developer.mozilla.org', 'freecodecamp.org']  # Reduced to top 2
+    for domain in fallback_domains:
+        if len(key_domains) >= max_domains:
+            break
+        if domain not in seen_domains:
+            seen_domains.add(domain)
+            key_domains.append(domain)
+    
+    return tuple(key_domains[:max_domains]), tuple(youtube_domains)
+
+
+# Shared finder and recent tool results, so repeated agent calls with the same
+# arguments skip both client setup and the network round trips
+_finder: Optional[LearningResourceFinder] = None
+_SEARCH_CACHE: "OrderedDict[str, Tuple[float, Dict]]" = OrderedDict()
+_SEARCH_CACHE_MAX_SIZE = 128
+_SEARCH_CACHE_TTL_SECONDS = 600
+
+# Persistent layer behind the in-memory cache, so search quota is also
+# saved across restarts of the CLI or agent process
+_disk_cache: Optional[diskcache.Cache] = None
+_disk_cache_failed = False
+_DISK_CACHE_SIZE_LIMIT = int(1e8)
+_DISK_CACHE_TTL_SECONDS = 7 * 86400
 
 
 # Tool interface for agentic LLMs
@@ -502,18 +735,21 @@ def find_learning_resources(topic_data, max_results: int = 5) -> Dict:
         ...     max_results=5
         ... )
     """
+    cache_key = _search_cache_key(topic_data, max_results)
+    cached = _SEARCH_CACHE.get(cache_key)
+    if cached is not None and time.monotonic() - cached[0] < _SEARCH_CACHE_TTL_SECONDS:
+        _SEARCH_CACHE.move_to_end(cache_key)
+        # Callers get their own lists, so editing a result never changes the cached entry
+        return copy.deepcopy(cached[1])
+    
+    # Fall back to the on-disk cache, which survives process restarts
+    stored = _load_disk_result(cache_key)
+    if stored is not None:
+        _remember_result(cache_key, stored)
+        return copy.deepcopy(stored)
+    
     try:
-        finder = LearningResourceFinder()
-        result = finder.find_learning_resources(topic_data, max_results)
-        
-        return {
-            'urls': result.urls,
-            'has_basics_tutorial': result.has_basics_tutorial,
-            'has_youtube_demo': result.has_youtube_demo,
-            'covered_topics': result.covered_topics,
-            'topic_coverage': result.topic_coverage,
-            'error': result.error
-        }
+        response = _get_finder().find_learning_resources(topic_data, max_results).as_dict()
     
     except Exception as e:
         return {
@@ -524,7 +760,83 @@ def find_learning_resources(topic_data, max_results: int = 5) -> Dict:
             'topic_coverage': {},
             'error': f"Tool initialization error: {e}"
         }
-        
+    
+    # Only successful searches are cached; errors are retried on the next call
+    if response['error'] is None:
+        _remember_result(cache_key, response)
+        _store_disk_result(cache_key, response)
+    
+    return copy.deepcopy(response)
+
+
+def _remember_result(cache_key: str, response: Dict) -> None:
+    """Store a tool result in the in-memory LRU, evicting the oldest entries."""
+    _SEARCH_CACHE[cache_key] = (time.monotonic(), response)
+    _SEARCH_CACHE.move_to_end(cache_key)
+    while len(_SEARCH_CACHE) > _SEARCH_CACHE_MAX_SIZE:
+        _SEARCH_CACHE.popitem(last=False)
+
+
+def _get_disk_cache() -> Optional[diskcache.Cache]:
+    """Open the persistent result cache on first use; None if it is unavailable."""
+    global _disk_cache, _disk_cache_failed
+    if _disk_cache is None and not _disk_cache_failed:
+        # A sibling of rag_answers, so neither cache culls or clears the other's files
+        cache_dir = os.path.join(
+            os.path.expanduser(os.getenv("LEARNERATOR_CACHE_DIR", "~/.learnerator_cache")), "search"
+        )
+        try:
+            _disk_cache = diskcache.Cache(cache_dir, size_limit=_DISK_CACHE_SIZE_LIMIT)
+        except Exception as e:
+            _disk_cache_failed = True
+            logger.warning("⚠️ Persistent search cache unavailable at %s: %s", cache_dir, e)
+    return _disk_cache
+
+
+def _load_disk_result(cache_key: str) -> Optional[Dict]:
+    """Read a tool result from the persistent cache; None on a miss or a cache error."""
+    disk_cache = _get_disk_cache()
+    if disk_cache is None:
+        return None
+    try:
+        return disk_cache.get(cache_key)
+    except Exception as e:
+        logger.warning("⚠️ Could not read persistent search cache: %s", e)
+        return None
+
+
+def _store_disk_result(cache_key: str, response: Dict) -> None:
+    """Write a tool result to the persistent cache, keeping only the memory copy on errors."""
+    disk_cache = _get_disk_cache()
+    if disk_cache is None:
+        return
+    try:
+        disk_cache.set(cache_key, response, expire=_DISK_CACHE_TTL_SECONDS)
+    except Exception as e:
+        logger.warning("⚠️ Could not write persistent search cache: %s", e)
+
+
+def _get_finder() -> LearningResourceFinder:
+    """Return the shared finder, creating its API clients on first use."""
+    global _finder
+    if _finder is None:
+        _finder = LearningResourceFinder()
+    return _finder
+
+
+def _search_cache_key(topic_data, max_results: int) -> str:
+    """Normalize a tool call into a stable key for the search cache."""
+    if isinstance(topic_data, dict):
+        topic = str(topic_data.get("header", ""))
+        keywords = [str(keyword) for keyword in topic_data.get("keywords", [])]
+        content = "|".join([str(topic_data.get("details", ""))] + keywords)
+    else:
+        topic, content = "", str(topic_data)
+    
+    key = f"{topic.lower().strip()}|{content.lower().strip()}|{max_results}"
+    return hashlib.md5(key.encode()).hexdigest()
+
+
 if __name__ == "__main__":
     # Example usage with new JSON format
     topic_data = {
@@ -1,3 +1,5 @@
+import json
+
 OPENAI_TOOLS = [
     {
         "type": "function",
@@ -27,4 +29,13 @@ OPENAI_TOOLS = [
             }
         }
     }
-]
\ No newline at end of file
+]
+
+# Compact serialized form of OPENAI_TOOLS, computed once at import for
+# callers that send the tool schema over HTTP themselves
+_OPENAI_TOOLS_JSON = json.dumps(OPENAI_TOOLS, separators=(',', ':')).encode()
+
+
+def get_openai_tools_json() -> bytes:
+    """Return OPENAI_TOOLS pre-serialized as compact JSON bytes."""
+    return _OPENAI_TOOLS_JSON
@@ -9,7 +9,7 @@ from dataclasses import dataclass
 
 
 # Vector Database Schema
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ContentChunk:
     """A chunk of content from a learning resource."""
     content: str
@@ -20,16 +20,8 @@ class ContentChunk:
     metadata: Dict
 
 
-@dataclass
-class SearchResult:
-    """A search result from the vector database."""
-    chunk: ContentChunk
-    similarity_score: float
-    metadata: Dict
-
-
 # Content Analysis Schema
-@dataclass
+@dataclass(slots=True)
 class ContentSummary:
     """Summary of content from a single source."""
     source_url: str
@@ -44,7 +36,7 @@ class ContentSummary:
     topic_category: str = "general"  # Add topic category
 
 
-@dataclass 
+@dataclass(slots=True)
 class ConceptRelationship:
     """Relationship between two concepts."""
     concept_a: str
@@ -54,17 +46,14 @@ class ConceptRelationship:
     strength: float  # 0.0 to 1.0
 
 
-@dataclass
-class KnowledgeMap:
-    """Collection of concept relationships."""
-@dataclass
+@dataclass(slots=True, frozen=True)
 class KnowledgeMap:
     """Collection of concept relationships."""
     relationships: List[ConceptRelationship]
 
 
 # Quiz Schema
-@dataclass
+@dataclass(slots=True, frozen=True)
 class QuizQuestion:
     """A quiz question with multiple choice answers."""
     question: str
@@ -75,7 +64,7 @@ class QuizQuestion:
     source_url: str
 
 
-@dataclass
+@dataclass(slots=True)
 class Quiz:
     """Complete quiz for testing knowledge."""
     title: str
@@ -86,7 +75,7 @@ class Quiz:
 
 
 # Database Summary Schema
-@dataclass
+@dataclass(slots=True)
 class DatabaseSummary:
     """Complete summary of the vector database content."""
     total_sources: int
@@ -99,8 +88,7 @@ class DatabaseSummary:
 
 
 # Learning Resource Finder Schema
-# Learning Resource Finder Schema
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SearchConfig:
     """Configuration for resource search."""
     max_results: int = 3
@@ -111,16 +99,17 @@ class SearchConfig:
     results_per_topic: int = 1  # One dedicated resource per specific topic
     min_youtube_ratio: float = 0.3  # At least 30% should be YouTube videos
     min_tutorial_ratio: float = 0.3  # At least 30% should be tutorial pages
+    max_concurrent_searches: int = 4  # Topics searched in parallel (shared by all requests)
 
 
-@dataclass
+@dataclass(slots=True)
 class ResourceSources:
     """Container for resource sources from LLM recommendations."""
     websites: List[str]
     youtube_channels: List[str]
 
 
-@dataclass
+@dataclass(slots=True)
 class SearchResult:
     """Container for search results."""
     urls: List[str]
@@ -130,8 +119,19 @@ class SearchResult:
     topic_coverage: Dict[str, List[str]]  # Maps topic to URLs covering it
     error: Optional[str] = None
 
+    def as_dict(self) -> Dict:
+        """Return the tool-facing fields as a dict without copying them."""
+        return {
+            'urls': self.urls,
+            'has_basics_tutorial': self.has_basics_tutorial,
+            'has_youtube_demo': self.has_youtube_demo,
+            'covered_topics': self.covered_topics,
+            'topic_coverage': self.topic_coverage,
+            'error': self.error
+        }
+
 
-@dataclass
+@dataclass(slots=True)
 class ResourceSearchResult:
     """Result from resource search operation."""
     success: bool
@@ -142,7 +142,7 @@ class ResourceSearchResult:
 
 
 # RAG Chatbot Schema
-@dataclass
+@dataclass(slots=True)
 class ChatResponse:
     """Response from the RAG chatbot."""
     answer: str